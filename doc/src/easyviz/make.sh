@@ -3,8 +3,8 @@
 # clean:
 rm -rf tmp_*
 
-# Make .p.py -> .py files and make sure most recent documentation of
-# Easyviz is in the __init__.py file:
+# The Easyviz tutorial is not in the __init__.py doc string, but in
+# lib/scitools/easyviz/_tutorial.rst (copied from the Sphinx version below)
 
 # Prepare Doconce files and filter them to various formats:
 cp easyviz.do.txt tmp_easyviz.do.txt
@@ -52,6 +52,7 @@ y
 y
 EOF
 mv tmp_easyviz.rst sphinx-rootdir
+cp sphinx-rootdir/tmp_easyviz.rst ../../../lib/scitools/easyviz/_tutorial.rst
 # index-sphinx is a ready-made version of index.rst:
 cp index-sphinx sphinx-rootdir/index.rst
 cp -r figs sphinx-rootdir/figs   # important for finding the figures...
@@ -10,11 +10,48 @@ Grab matplolib backend to prepare and tweak easyviz plots
 
 __author__ = 'Rolv Erlend Bredesen <rolv@simula.no>'
 
-from scitools.easyviz.matplotlib_ import *
+import os
+if __name__ == '__main__' and not os.environ.get('DISPLAY'):
+    # No display: let the matplotlib backend use the Agg rasterizer
+    # (overrides the backend option in the [matplotlib] section of
+    # scitools.cfg, must be set before easyviz imports pyplot)
+    os.environ.setdefault('SCITOOLS_matplotlib_backend', 'Agg')
+
+from scitools.easyviz.matplotlib_ import plot, hardcopy, get_backend, backend
+import sys
+import matplotlib
+from matplotlib.ticker import MultipleLocator, FormatStrFormatter
+from matplotlib.font_manager import FontProperties
 import numpy as np
 
+# The backend is fixed for the lifetime of the process: grab it once
+pyplot = get_backend() if backend == 'matplotlib' else None
+
+_TWO_PI = 2*np.pi
+
+# Font set from matplotlib (check matplotlib's fonts_demo), built once
+_XSMALL_FP = FontProperties(size='x-small')
+
+# rcParams set by _pyplot_thick_frame (same order as its values tuple)
+_THICK_FRAME_KEYS = ('lines.linewidth',
+                     'ytick.labelsize',
+                     'ytick.major.pad',
+                     'ytick.minor.pad',
+                     'ytick.major.size',
+                     'ytick.minor.size',
+                     'xtick.labelsize',
+                     'xtick.major.pad',
+                     'xtick.minor.pad',
+                     'xtick.major.size',
+                     'xtick.minor.size',
+                     'lines.markeredgewidth',
+                     'axes.linewidth',
+                     )
+_thick_frame_cache = {}  # (lines, width, size, labelsize) -> rcParams dict
+
 def _pyplot_thick_frame(lines=10,  width=5, size=8, labelsize=20):
-    """Prepare matplotlib backend with parameters for a nice thick frame
+    """Return matplotlib rcParams for a nice thick frame, to be used as
+    ``with matplotlib.rc_context(_pyplot_thick_frame()): ...``
     lines: width of plot lines
     width: width of frame line (and tick marks)
     size: length of tick marks
@@ -25,36 +62,59 @@ def _pyplot_thick_frame(lines=10,  width=5, size=8, labelsize=20):
      lines.markeredgewidth will also change size of markers used in plots.
      It appears that this is the only way to set the width of tickmarks.
      The markeredgewidth applies to the black line surrounding a marker,
-     making it appear circular and black if it's set to high. """
-    pyplot.rcParams.update({
-        'lines.linewidth': lines ,         # Plotline width
-        'ytick.labelsize': labelsize,
-        'ytick.major.pad': size,
-        'ytick.minor.pad': size,
-        'ytick.major.size': size*1.8,      # Tickmark length
-        'ytick.minor.size': size,
-        'xtick.labelsize': labelsize,
-        'xtick.major.pad': size,
-        'xtick.minor.pad': size,
-        'xtick.major.size': size*1.8,        
-        'xtick.minor.size': size,
-        'lines.markeredgewidth': size/3,   # Tickmark border width 
-        'axes.linewidth': width,           # Frame width
-        })
+     making it appear circular and black if it's set to high.
+     The returned dict is cached for each set of arguments and must
+     not be modified. """
+    args = (lines, width, size, labelsize)
+    if args in _thick_frame_cache:
+        return _thick_frame_cache[args]
+    values = (lines,           # Plotline width
+              labelsize,
+              size,
+              size,
+              size*1.8,        # Tickmark length
+              size,
+              labelsize,
+              size,
+              size,
+              size*1.8,
+              size,
+              size/3,          # Tickmark border width
+              width,           # Frame width
+              )
+    params = _thick_frame_cache[args] = dict(zip(_THICK_FRAME_KEYS, values))
+    return params
     
+def _multiple_locator_interval(locator):
+    """Return the tick interval of a MultipleLocator (None otherwise)."""
+    if not isinstance(locator, MultipleLocator):
+        return None
+    edge = getattr(locator, '_edge', None)  # matplotlib >= 3.0
+    if edge is not None:
+        return edge.step
+    return locator._base.get_base()
+
 def _pyplot_major_minor(axis='y',
                        major_tick_interval=1, minor_tick_interval=.2):
     """Use both major and minor ticks on given axis.
     Must be applied as a postprocess after the easyviz plot"""
+    ax = pyplot.gca()
+    if axis == 'x':
+        axis = ax.xaxis
+    elif axis == 'y':
+        axis = ax.yaxis
+    # Nothing to do (and no redraw) if the ticks are already set up
+    formatter = axis.get_major_formatter()
+    if _multiple_locator_interval(axis.get_major_locator()) == \
+           major_tick_interval and \
+       _multiple_locator_interval(axis.get_minor_locator()) == \
+           minor_tick_interval and \
+       isinstance(formatter, FormatStrFormatter) and formatter.fmt == "%d":
+        return
     # Use both major and minor ticks
-    from matplotlib.ticker import MultipleLocator, FormatStrFormatter
     majorLocator = MultipleLocator(major_tick_interval)
     majorFormatter = FormatStrFormatter("%d")
     minorLocator = MultipleLocator(minor_tick_interval)
-    if axis == 'x':
-        axis = pyplot.gca().xaxis
-    elif axis == 'y':
-        axis = pyplot.gca().yaxis
     axis.set_minor_locator(minorLocator)
     axis.set_major_locator(majorLocator)
     axis.set_major_formatter(majorFormatter)
@@ -62,44 +122,45 @@ def _pyplot_major_minor(axis='y',
     pyplot.draw()
 
 def main():
-    x = np.linspace(0, 5, 101)
-    y = np.sin(2*np.pi*x)
+    x = np.linspace(0.0, 5.0, 101)
+    y = np.empty_like(x)
+    np.multiply(x, _TWO_PI, y)  # y = sin(2*pi*x) without temporaries
+    np.sin(y, y)
     plot(y, '-o', x=x, log='x', xmin=.04, xmax=1, ymin=-1.1, ymax=1.1)
     
 if __name__ == '__main__':
     main()
-    hardcopy('tmp_normal_frame.png')
+    hardcopy('tmp_normal_frame.png', dpi=100)
 
     if backend != 'matplotlib':
         print 'Cannot demonstrate matplotlib specialities when backend (%s) is not matplotlib!' % (backend)
     else:
-        pyplot = get_backend()
-
-        # Setup parameters for thicker frame and tickmarks 
-        _pyplot_thick_frame()
+        # Parameters for thicker frame and tickmarks, only active
+        # within the with block (global rcParams are left untouched)
+        with matplotlib.rc_context(_pyplot_thick_frame()):
+            # Normal easyviz plotting
+            main()
 
-        # Normal easyviz plotting
-        main()
+            # Major and minor ticks for the y axis
+            _pyplot_major_minor(axis='y')
 
-        # Major and minor ticks for the y axis
-        _pyplot_major_minor(axis='y')
+            # Title using latex and specific fontsize 
+            pyplot.title(r'y=sin(2\pi x)', fontsize=20) 
 
-        # Title using latex and specific fontsize 
-        pyplot.title(r'y=sin(2\pi x)', fontsize=20) 
+            # Place text at given location in plot (position by data coordinates)
+            pyplot.text(.05, -.8, 'Check out the nice thick frame',
+                       {'size':20}, horizontalalignment='left',)
 
-        # Place text at given location in plot (position by data coordinates)
-        pyplot.text(.05, -.8, 'Check out the nice thick frame',
-                   {'size':20}, horizontalalignment='left',)
-        
-        # Use backend hardcopy since normal hardcopy would reset text and title
-        pyplot.savefig('tmp_thick_frame.png')  
+            # Use backend hardcopy since normal hardcopy would reset text and title
+            # (fixed dpi and no tight bbox: the figure is rendered only once)
+            pyplot.savefig('tmp_thick_frame.png', dpi=100, bbox_inches=None)
 
-        # Load a font set from matplotlib (check matplotlib's fonts_demo)
-        from matplotlib.font_manager import fontManager, FontProperties
+        # Use the predefined x-small font
         pyplot.text(1, 1, 'Added some text using x-small font',
-                   fontproperties=FontProperties(size='x-small'),
+                   fontproperties=_XSMALL_FP,
                    horizontalalignment='right',
                    transform=pyplot.gca().transAxes)  # figure coordinates
-            
-    raw_input('Press Return key to quit: ')
+
+    if sys.stdin.isatty():
+        raw_input('Press Return key to quit: ')
     
@@ -5,8 +5,16 @@ import time, glob, os
 for name in glob.glob('tmp_*.eps'):
     os.remove(name)
 
-def f(x, m, s):
-    return (1.0/(sqrt(2*pi)*s))*exp(-0.5*((x-m)/s)**2)
+def f(x, m, s, out=None):
+    if out is None:
+        return (1.0/(sqrt(2*pi)*s))*exp(-0.5*((x-m)/s)**2)
+    # same formula, evaluated in place in the array out (no temporaries)
+    subtract(x, m, out)
+    multiply(out, out, out)
+    multiply(out, -0.5/(s*s), out)
+    exp(out, out)
+    multiply(out, 1.0/(sqrt(2*pi)*s), out)
+    return out
 
 m = 0
 s_start = 2
@@ -18,16 +26,19 @@ max_f = f(m, m, s_stop)
 
 # Show the movie, and make hardcopies of frames simulatenously
 counter = 0
+frames = []  # names of the plot files, in the right order
+y = zeros(len(x))  # reused for all frames (each plot replaces the curve)
 for s in s_values:
-    y = f(x, m, s)
+    f(x, m, s, out=y)
+    frames.append('tmp_%04d.png' % counter)
     plot(x, y, axis=[x[0], x[-1], -0.1, max_f],
          xlabel='x', ylabel='f', legend='s=%4.2f' % s,
-         hardcopy='tmp_%04d.png' % counter)
+         hardcopy=frames[-1])
     counter += 1
     #time.sleep(0.2)  # can insert a pause to control movie speed
 
 # Make movie file the simplest possible way
-movie('tmp_*.png')
+movie(frames)
 import glob, os
 print 'generated the file', glob.glob('movie.*')[0]
 #os.remove(glob.glob('movie.*')[0])
@@ -4,9 +4,7 @@ def f(t):
     return t**2*exp(-t**2)
 
 t = linspace(0, 3, 31)    # 31 points between 0 and 3
-y = zeros(len(t), 'd')    # 31 doubles ('d')
-for i in xrange(len(t)):
-    y[i] = f(t[i])
+y = f(t)                  # compute all f values at once
 
 plot(t, y)
 savefig('plot1a.png')
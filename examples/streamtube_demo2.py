@@ -3,10 +3,21 @@
 # Example taken from:
 # http://www.mathworks.com/access/helpdesk/help/techdoc/visualize/f5-6736.html
 
-from scitools.easyviz import *
-from scipy import io
-
-wind = io.loadmat('wind_matlab_v6.mat')
+from scitools.easyviz import setp, slice_, hold, gca, colormap, hsv, \
+     contourslice, daspect, streamtube, view, grid, show
+from scitools.numpyutils import seq
+from numpy import sqrt, ones, linspace
+import numpy
+
+# loadmat is slow, so the arrays are stored in NumPy's own format the first
+# time and read from there in later runs (clean.sh removes tmp_wind.npz):
+try:
+    wind = numpy.load('tmp_wind.npz')
+except IOError:
+    from scipy import io
+    wind = io.loadmat('wind_matlab_v6.mat')
+    numpy.savez('tmp_wind.npz', **dict([(name, wind[name]) \
+                                        for name in 'x y z u v w'.split()]))
 x = wind['x']
 y = wind['y']
 z = wind['z']
@@ -14,11 +25,15 @@ u = wind['u']
 v = wind['v']
 w = wind['w']
 
-xmin = arrmin(x)
-xmax = arrmax(x)
-ymin = arrmin(y)
+xmin = x.min()
+xmax = x.max()
+ymin = y.min()
 alt = 7.356 # z-value for slice and streamtube plane
-wind_speed = sqrt(u**2 + v**2 + w**2)
+# sqrt(u**2 + v**2 + w**2) computed in one array:
+wind_speed = u*u
+wind_speed += v*v
+wind_speed += w*w
+sqrt(wind_speed, wind_speed)
 
 setp(interactive=False)
 
@@ -44,7 +59,11 @@ hcont = contourslice(x,y,z,wind_speed,xmax,ymin,alt,cont_intervals.tolist())
 hcont.setp(linewidth=2)
 
 # Create the Stream Tubes:
-sx,sy,sz = ndgrid([xmin]*11,seq(20,50,3),[alt]*11)
+# one line of starting points, x=xmin and z=alt (as meshgrid(xmin,20:3:50,alt)
+# in Matlab):
+sy = seq(20,50,3)
+sx = xmin*ones(len(sy))
+sz = alt*ones(len(sy))
 daspect([1,1,1]) # set DAR before calling streamtube
 htubes = streamtube(x,y,z,u,v,w,sx,sy,sz)#,[1.25, 5])
 #set(htubes,'EdgeColor','none','FaceColor','r','AmbientStrength',.5)
@@ -4,7 +4,8 @@
 Example on how to work with references to objects and the setp command.
 """
 
-from scitools.std import *
+from scitools.easyviz import setp, subplot, plot, show
+from numpy import linspace, pi, sin, cos
 
 setp(interactive=False)
 
@@ -10,7 +10,10 @@ Import of Numerical Python
     are more general).
 
     The user can turn off import of scipy in the configuration file
-    (see below).
+    (see below). This is the default, since importing scipy takes
+    considerable time. scipy is then still available as the name
+    scipy (if installed), but the module is not imported before
+    one of its attributes, e.g., scipy.special, is used.
 
   - If scipy is not available or not wanted, two options are possible,
     depending on what is set in the "numpy" section of the configuration
@@ -125,6 +128,45 @@ if not has_scipy:
             raise ImportError('numpy was requested, but it could not be found')
         _t2 = _time.clock(); _import_times += 'numpy=%g ' % (_t2 - _t1)
 
+# without from scipy import *, scipy is still available as a module
+# that is imported the first time one of its attributes is used
+# (saves the import time of scipy in programs that never use it):
+class _LazyModule(object):
+    """Stand-in for a module that is imported on first attribute access."""
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+
+    def __getattr__(self, attr):
+        # only called for attributes not found in the instance
+        import importlib
+        if '_module' not in self.__dict__:
+            self.__dict__['_module'] = importlib.import_module(self._name)
+        try:
+            return getattr(self._module, attr)
+        except AttributeError:
+            # a subpackage (e.g. scipy.special) that the package does
+            # not import itself:
+            try:
+                return importlib.import_module(self._name + '.' + attr)
+            except ImportError:
+                raise AttributeError("'module' object has no attribute '%s'"
+                                     % attr)
+
+    def __repr__(self):
+        if '_module' in self.__dict__:
+            return repr(self._module)
+        return "<module '%s' (not yet imported)>" % self._name
+
+if not has_scipy:
+    import imp
+    try:
+        imp.find_module('scipy')   # no import, just check if it is there
+        scipy = _LazyModule('scipy')
+        _import_list.append("scipy = (imported on first use)")
+    except ImportError:
+        pass
+    del imp
+
 # nice to have imports:
 import sys, operator, math
 from scitools.StringFunction import StringFunction
@@ -5,9 +5,11 @@ from scitools.numpyutils import seq, iseq, asarray, ones, zeros, sqrt, shape, \
 from scitools.globaldata import backend
 
 from .misc import _check_xyz, _check_xyuv, _check_xyzuvw, _check_xyzv, \
-     _check_size, _check_type, _toggle_state, _update_from_config_file
+     _check_size, _check_type, _toggle_state, _update_from_config_file, \
+     _file_writer
 
 from warnings import warn
+from contextlib import contextmanager
 
 
 def docadd(comment, *lists, **kwargs):
@@ -454,6 +456,10 @@ class Line(PlotProperties):
             self._set_data(x, y)
 
     def _set_data(self, x, y, z=None):
+        # convert lists etc. to arrays once, such that the min/max
+        # computations and the backends work on arrays
+        x = asarray(x)
+        y = asarray(y)
         self._set_lim(x, 'xlim')
         self._set_lim(y, 'ylim')
         self._prop['xdata'] = x
@@ -461,6 +467,7 @@ class Line(PlotProperties):
         self._prop['dims'] = (len(x), 1, 1)
         self._prop['numberofpoints'] = len(x)
         if z is not None:
+            z = asarray(z)
             self._set_lim(z, 'zlim')
             self._prop['zdata'] = z
             self._prop['dims'] = (len(x), len(y), 1)
@@ -2242,6 +2249,17 @@ class BaseClass(object):
         pickle.dump(self._figs, handle)
         handle.close()
 
+    def flush_savefig(self):
+        """
+        Wait until all hardcopies (savefig/hardcopy calls) are written
+        to file. This is only necessary when files are saved in the
+        background, e.g., with savefig(filename, background=True) in
+        the Matplotlib backend, and they are to be used before the
+        program ends by something else than the movie function (which
+        calls flush_savefig itself).
+        """
+        _file_writer.flush()
+
     def hardcopy(self, filename, **kwargs):
         """
         Save a hardcopy of the current figure to file (with the given
@@ -3128,6 +3146,14 @@ class BaseClass(object):
         if not ax.getp('hold') and not 'box' in kwargs:
             kwargs['box'] = True
 
+        # A hardcopy is made after the replot below, such that the
+        # figure is not drawn twice (in hardcopy and here) for each call
+        # (which matters in animation loops making one file per frame)
+        hardcopy = None
+        for key in ('hardcopy', 'savefig'):  # savefig is a synonym
+            if key in kwargs:
+                hardcopy = kwargs.pop(key)
+
         # set keyword arguments in all the added lines
         for line in lines:
             line.setp(**kwargs)
@@ -3138,8 +3164,13 @@ class BaseClass(object):
         self.gcf().setp(**kwargs)
         self.setp(**kwargs)
 
+        replotted = False
         if self.getp('interactive') and self.getp('show'):
             self._replot()
+            replotted = True
+
+        if hardcopy is not None:
+            self.hardcopy(hardcopy, replot=not replotted)
 
         return lines
 
@@ -4407,6 +4438,31 @@ class BaseClass(object):
         """Redraw the current figure."""
         self._replot()
 
+    @contextmanager
+    def delay_redraw(self):
+        """
+        Delay the redrawing of the figure until the end of a with block.
+
+        In interactive mode, every plotting command (plot, title, axis,
+        subplot, etc.) redraws the current figure. When a figure is built
+        by many commands, e.g., with several axes from subplot, the
+        commands can be collected in a with block such that the figure
+        is drawn only once, at the end of the block:
+
+        >>> with delay_redraw():
+        ...     subplot(2,1,1); plot(t, y1, xlabel='t', ylabel='y')
+        ...     subplot(2,1,2); plot(t, y2, xlabel='t', ylabel='y')
+        ...     title('A figure with two plots')
+        """
+        interactive = self.getp('interactive')
+        self.setp(interactive=False)
+        try:
+            yield
+        finally:
+            self.setp(interactive=interactive)
+        if interactive and self.getp('show'):
+            self._replot()
+
     def hidden(self, *args):
         """Toggle hidden line removal in the current axis.
 
@@ -5314,6 +5370,36 @@ class BaseClass(object):
                                   self.__class__.__name__)
 
 
+class _DoNothing(object):
+    """
+    Stand-in for the plotting commands after turn_off_plotting.
+    Calls and attribute lookups do nothing and return the same object,
+    so also code like gca().setp(...) is silently ignored, without
+    creating new objects in every call as scitools.misc.DoNothing does.
+    """
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __getattr__(self, name):
+        return self
+
+    def __iter__(self):
+        return iter(())
+
+    # with delay_redraw(): ... must also work when plotting is off
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None  # exceptions in the with block are not swallowed
+
+    def __repr__(self):
+        return ''
+
+_do_nothing = _DoNothing()
+
 def turn_off_plotting(namespace=globals()):
     """Call turn_off_plotting(globals()) to turn off all plotting."""
     use(namespace['plt'], namespace, True)
@@ -5321,9 +5407,9 @@ def turn_off_plotting(namespace=globals()):
 def use(plt, namespace=globals(), neutralize=False):
     """
     Export the namespace of backend instance to namespace.
-    If neutralize is True, the plt object will be replaced
-    by a scitools.misc.DoNothing object so that no plotting
-    command will do anything. This can be used to efficiently
+    If neutralize is True, the plt object and all the plotting
+    commands will be replaced by one object that accepts any call
+    and does nothing. This can be used to efficiently
     turn off all plotting in a program.
     Just call turn_off_plotting(globals()) before the first
     plot command in your program.
@@ -5331,8 +5417,7 @@ def use(plt, namespace=globals(), neutralize=False):
     plt_dict = {}
     plt_orig = plt
     if neutralize:
-        import scitools.misc
-        plt = scitools.misc.DoNothing()
+        plt = _do_nothing
     plt_dict['plt'] = plt
     for item in plt_orig.__dict__:
         plt_dict[item] = eval('plt.'+item)
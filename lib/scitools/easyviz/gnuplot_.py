@@ -36,7 +36,7 @@ from scitools.numpyutils import ones, ravel, shape, newaxis, transpose, \
      linspace, floor, array
 from scitools.globaldata import DEBUG, VERBOSE
 from scitools.misc import check_if_module_exists , system
-from .misc import _update_from_config_file, _check_type
+from .misc import _update_from_config_file, _check_type, _file_writer
 import collections
 
 check_if_module_exists('Gnuplot', msg='You need to install the Gnuplot.py package.', abort=False)
@@ -1421,8 +1421,13 @@ class GnuplotBackend(BaseClass):
         fontname = kwargs.get('fontname', 'Helvetica')
         keyw = {'filename': filename, 'terminal': terminal}
 
-        # Create a new Gnuplot instance only for now
-        self._g = Gnuplot.Gnuplot()
+        # Use a separate Gnuplot instance for hardcopies. It is kept
+        # running between hardcopies (starting gnuplot for each frame
+        # in a movie is expensive) and is stopped in _close_hardcopy_g.
+        if getattr(self, '_hardcopy_g', None) is None:
+            self._hardcopy_g = Gnuplot.Gnuplot()
+            _file_writer.add_flush_hook(self._close_hardcopy_g)
+        self._g = self._hardcopy_g
         setterm = ['set', 'terminal', terminal]
         if terminal == 'postscript':
             fontsize = kwargs.get('fontsize', 20)
@@ -1476,7 +1481,9 @@ class GnuplotBackend(BaseClass):
             # Need to call hardcopy in Gnuplot.py to avoid ending up with
             # a PostScript file with multiple pages:
             self._g.hardcopy(**keyw)
-        self._g('quit')
+        self._g('set output')  # close the file
+        # the file must be complete when hardcopy returns:
+        self._sync_hardcopy_g()
         self._g = self.gcf()._g  # set self._g to the correct instance again
         self._doing_PS = False
 
@@ -1577,6 +1584,42 @@ class GnuplotBackend(BaseClass):
             self._g = self.gcf()._g # set _g to the correct instance again
 
     # reimplement methods like clf, closefig, closefigs
+    def _sync_hardcopy_g(self, timeout=60):
+        """Wait until the gnuplot process for hardcopies has carried out
+        all commands sent to it so far. Nothing can be read back from
+        gnuplot, so it is asked to print a line to a new file, and the
+        line is waited for."""
+        g = getattr(self, '_hardcopy_g', None)
+        if g is None:
+            return
+        fd, sentinel = tempfile.mkstemp(prefix='tmp_easyviz_gnuplot_',
+                                        suffix='.txt')
+        os.close(fd)
+        try:
+            g('set print "%s"' % sentinel.replace('\\', '/'))
+            g('print "done"')
+            g('set print')  # close the file
+            t0 = time.time()
+            delay = 0.001
+            while open(sentinel).read().strip() != 'done':
+                if time.time() - t0 > timeout:
+                    print 'gnuplot did not finish the hardcopy in %g s' % \
+                          timeout
+                    break
+                time.sleep(delay)
+                delay = min(2*delay, 0.05)
+        finally:
+            os.remove(sentinel)
+
+    def _close_hardcopy_g(self):
+        """Stop the gnuplot process for hardcopies and wait until it
+        has written all files."""
+        g = getattr(self, '_hardcopy_g', None)
+        if g is not None:
+            self._hardcopy_g = None
+            g('quit')
+            g.close()
+
     def clf(self):
         """Clear current figure."""
         BaseClass.clf(self)
@@ -1596,6 +1639,7 @@ class GnuplotBackend(BaseClass):
         """Close figure windows and stop gnuplot."""
         for key in self._figs:
             self._figs[key]._g('quit')
+        self._close_hardcopy_g()
         del self._g
         self._figs = {1:Figure()}
         self._figs[1]._g = Gnuplot.Gnuplot()
@@ -37,9 +37,9 @@ http://www.mathworks.com/support/solutions/data/1-1A62W.html).
   x = linspace(0,5,31)
   for i in range(10):
       plot(x,cos(-0.1*i+x),ymin=-1.1,ymax=1.1)
-      hardcopy('/tmp/img_%02d.eps' % i)
+      hardcopy('/tmp/img_%02d.png' % i)
       close()
-  movie('/tmp/img_%02d.eps')
+  movie('/tmp/img_%02d.png')
 
 """
 
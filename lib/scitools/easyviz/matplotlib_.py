@@ -30,7 +30,7 @@ from .common import *
 from scitools.numpyutils import floor, linspace, array
 from scitools.globaldata import DEBUG, VERBOSE
 from scitools.misc import check_if_module_exists
-from .misc import _update_from_config_file
+from .misc import _update_from_config_file, _file_writer
 
 check_if_module_exists('matplotlib', msg='You need to install the Matplotlib package.', abort=False)
 
@@ -1053,6 +1053,14 @@ class MatplotlibBackend(BaseClass):
           dpi         -- image resolution. Default is 100.
           orientation -- 'portrait' (default) or 'landscape'. Only available
                          for PostScript output.
+          background  -- if True, the file is written in a background
+                         thread, such that e.g. the next frame of a movie
+                         can be computed while the previous one is saved.
+                         The figure is still rendered (in memory) before
+                         hardcopy returns, only the writing is deferred.
+                         Default False. (The movie function waits for
+                         pending files, other programs must call
+                         flush_savefig first.)
 
         Note: if `filename` is just the file extension, such as ``.svg``,
         the file content is returned as a string *and* saved to
@@ -1083,6 +1091,23 @@ class MatplotlibBackend(BaseClass):
             imgdata.seek(0)
             filename = 'tmp' + filename  # dump to file too
 
+        if kwargs.get('background', False) and imgdata is None:
+            from StringIO import StringIO
+            buf = StringIO()
+            # same file format and name as savefig(filename) would use:
+            format = os.path.splitext(filename)[1][1:]
+            if not format:
+                format = self._g.gcf().canvas.get_default_filetype()
+                filename = filename.rstrip('.') + '.' + format
+            self._g.savefig(buf,
+                            format=format,
+                            dpi=dpi,
+                            facecolor='w',
+                            edgecolor='w',
+                            orientation=orientation)
+            _file_writer.write(filename, buf.getvalue())
+            return None
+
         self._g.savefig(filename,
                         dpi=dpi,
                         facecolor='w',
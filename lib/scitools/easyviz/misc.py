@@ -1,4 +1,5 @@
 import os
+import threading, Queue, atexit
 
 from scitools.numpyutils import asarray, ones, seq, shape, reshape, meshgrid, \
      ndarray
@@ -291,3 +292,61 @@ def _cmpPlotProperties(a,b):
     assert len(PlotProperties.__class__.__subclasses__(PlotProperties)) == \
                len(plotorder) # Check all subclasses is in plotorder
     return cmp(plotorder.index(a.__class__),plotorder.index(b.__class__))
+
+
+class _BackgroundFileWriter(object):
+    """
+    Write files in a separate thread such that the caller (e.g. a loop
+    computing the next frame of a movie) does not have to wait for the
+    disk. Data are given as strings and written in the order received.
+    At most maxsize files wait in memory; write blocks when the queue
+    is full (the disk is then the bottleneck anyway).
+    """
+    def __init__(self, maxsize=2):
+        self._queue = Queue.Queue(maxsize)
+        self._thread = None
+        self._errors = []
+        self._flush_hooks = []
+
+    def add_flush_hook(self, func):
+        """
+        Let flush also call func(), which must return when files that
+        are written by some other means (e.g. a plotting program running
+        in a separate process) are complete.
+        """
+        if func not in self._flush_hooks:
+            self._flush_hooks.append(func)
+
+    def write(self, filename, data):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.setDaemon(True)
+            self._thread.start()
+        self._queue.put((filename, data))
+
+    def _run(self):
+        while True:
+            filename, data = self._queue.get()
+            try:
+                try:
+                    f = open(filename, 'wb')
+                    f.write(data)
+                    f.close()
+                except Exception as e:
+                    self._errors.append('%s: %s' % (filename, e))
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait until all pending files are written."""
+        for func in self._flush_hooks:
+            func()
+        if self._thread is not None:
+            self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise IOError('could not write file(s):\n' + '\n'.join(errors))
+
+_file_writer = _BackgroundFileWriter()
+# pending files must reach the disk before the program exits:
+atexit.register(_file_writer.flush)
@@ -1,9 +1,161 @@
 #!/usr/bin/env python
 
-import os, glob, re
+import os, sys, glob, re, threading, time, shutil, tempfile
 
 from scitools.misc import findprograms
-from misc import _check_type
+from misc import _check_type, _file_writer
+
+_installed = {}  # (program, PATH) -> True/False
+def _findprogram(*programs):
+    """Return True if all the given programs are installed (empty names
+    are ignored). The search in PATH is done only once for each program.
+    """
+    path = os.environ.get('PATH', '')
+    for program in programs:
+        if not program:
+            continue
+        key = (program, path)
+        if key not in _installed:
+            _installed[key] = findprograms(program)
+        if not _installed[key]:
+            return False
+    return True
+
+def _enlarge_pipe(fd, nbytes):
+    """Try to make the kernel buffer of the pipe fd hold nbytes (Linux
+    only). The writer then blocks less often when the reader is slow.
+    The size is limited by /proc/sys/fs/pipe-max-size (1 MB by default,
+    can be raised by root).
+    """
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        import fcntl
+        F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)
+        f = open('/proc/sys/fs/pipe-max-size')
+        max_size = int(f.read())
+        f.close()
+        fcntl.fcntl(fd, F_SETPIPE_SZ, min(nbytes, max_size))
+    except (ImportError, IOError, OSError, ValueError):
+        pass  # keep the default size (64 KB)
+
+try:
+    from PIL import Image as _Image
+except ImportError:
+    try:
+        import Image as _Image  # old PIL installations
+    except ImportError:
+        _Image = None
+
+def _cpu_count():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+def _run_pipeline(pipeline, output_file=None):
+    """
+    Run the programs in pipeline, a list of argument lists, without a
+    shell: the standard output of each program is connected to the
+    standard input of the next, and the output of the last program is
+    written to output_file (if given). Return 0 if all programs
+    succeeded, otherwise a nonzero exit status.
+    """
+    import subprocess
+    # close_fds: the pipes must not leak into pipelines started by
+    # other threads, or the readers would never see end of file
+    close_fds = os.name == 'posix'
+    out = None
+    if output_file is not None:
+        out = open(output_file, 'wb')
+    procs = []
+    stdin = None
+    failure = 0
+    try:
+        for i, argv in enumerate(pipeline):
+            if i == len(pipeline) - 1:
+                stdout = out
+            else:
+                stdout = subprocess.PIPE
+            p = subprocess.Popen(argv, stdin=stdin, stdout=stdout,
+                                 close_fds=close_fds)
+            if stdin is not None:
+                stdin.close()  # now only read by p
+            stdin = p.stdout
+            procs.append(p)
+    except OSError as e:
+        print '... could not run %s: %s' % (argv[0], e)
+        if stdin is not None:
+            stdin.close()
+        failure = 127
+    if out is not None:
+        out.close()
+    status = [p.wait() for p in procs]
+    return failure or max(status + [0], key=abs)
+
+def _pipeline2str(pipeline, output_file=None):
+    """Return the shell command corresponding to _run_pipeline."""
+    cmd = ' | '.join([' '.join(argv) for argv in pipeline])
+    if output_file is not None:
+        cmd += ' > %s' % output_file
+    return cmd
+
+def _run_commands(cmds, nworkers=None):
+    """Run the commands in cmds, each a (pipeline, output_file) pair
+    for _run_pipeline, with at most nworkers of them at the same time
+    (default: the number of CPUs). Return a list with the exit status
+    of each command.
+    """
+    if nworkers is None:
+        nworkers = _cpu_count()
+    status = [None]*len(cmds)
+    next_cmd = iter(range(len(cmds))).next
+    lock = threading.Lock()
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                try:
+                    i = next_cmd()
+                except StopIteration:
+                    return
+            finally:
+                lock.release()
+            status[i] = _run_pipeline(*cmds[i])
+    threads = [threading.Thread(target=worker)
+               for j in range(max(1, min(nworkers, len(cmds))))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return status
+
+def _pil_save(job):
+    """Convert one image with PIL. job is an (input file, output file,
+    size, PIL format) tuple. Return None, or the error message if the
+    file could not be converted.
+    """
+    file_, new_file, size, format = job
+    try:
+        img = _Image.open(file_)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        if size is not None:
+            img = img.resize(size, _Image.ANTIALIAS)
+        options = {}
+        if format == 'JPEG':
+            options['quality'] = 100  # don't lose quality
+        elif format == 'PNG':
+            # the file is only read once by the encoder, so fast
+            # compression matters more than a small file:
+            options['compress_level'] = 1
+        img.save(new_file, format, **options)
+    except IOError as e:
+        if os.path.isfile(new_file):
+            os.remove(new_file)
+        return str(e)
+    return None
 
 class MovieEncoder(object):
     """
@@ -33,18 +185,22 @@ class MovieEncoder(object):
         'gop_size': None,            # size of GOP (group of pictures)
         'force_conversion': False,   # force conversion (to png) if True
         'cleanup': True,             # clean up temporary files
+        'remove_frames': False,      # remove begin_movie_session folder
+        'nworkers': None,            # parallel conversions (None: no. of CPUs)
+        'threads': None,             # encoder threads (None: no. of CPUs)
+        'stream': False,             # pipe decoded frames to ffmpeg/avconv
         }
     _legal_encoders = 'convert mencoder ffmpeg avconv mpeg_encode ppmtompeg '\
                       'mpeg2enc html'.split()
     _legal_file_types = 'png gif jpg ps eps bmp tif tga pnm'.split()
 
     def __init__(self, input_files, **kwargs):
-        self._prop = {}
-        self._prop.update(self._local_prop)
-        self._prop['input_files'] = input_files
-        for key in kwargs:
-            if key in self._prop:
-                self._prop[key] = kwargs[key]
+        self._prop = dict(self._local_prop, input_files=input_files,
+                          **dict([(key, kwargs[key]) for key in kwargs \
+                                  if key in self._local_prop]))
+        self._size = self._parse_size(self._prop['size'])
+        self._tmp_dir = None  # folder for temporary files (see _tmp_prefix)
+        self._aspect = self._parse_aspect_ratio(self._prop['aspect'])
 
         print '\n\n' # provide some space before print statements
 
@@ -52,8 +208,11 @@ class MovieEncoder(object):
         encoder = self._prop['encoder']
         if encoder is None:
             # No encoder given, find the first installed among the legal ones
-            for enc in self._legal_encoders:
-                if findprograms(enc):
+            encoders = self._legal_encoders
+            if self._prop['stream']:
+                encoders = ['ffmpeg', 'avconv'] + encoders
+            for enc in encoders:
+                if _findprogram(enc):
                     encoder = enc
                     break
             if encoder is None:
@@ -64,7 +223,7 @@ class MovieEncoder(object):
             if not encoder in self._legal_encoders:
                 raise ValueError("encoder must be %s, not '%s'" %
                                  (self._legal_encoders, encoder))
-            if not encoder.startswith('html') and not findprograms(encoder):
+            if not encoder.startswith('html') and not _findprogram(encoder):
                 raise Exception("The selected encoder (%s) is not installed" \
                                 % encoder)
 
@@ -87,6 +246,8 @@ class MovieEncoder(object):
                 wildcard_format = m.group(1) + '*' + m.group(2)
             else:
                 wildcard_format = input_files
+            # (glob lists the directory once, so the files found need
+            # not be checked one by one)
             all_input_files = glob.glob(wildcard_format)
             if not all_input_files:
                 print 'No files of the form %s exist.' % input_files
@@ -94,14 +255,23 @@ class MovieEncoder(object):
                 print 'Found %d files of the format %s.' % \
                 (len(all_input_files), input_files)
         else:  # list of specific filenames
-            all_input_files = input_files
-        error_encountered = False
-        for f in all_input_files:
-            if not os.path.isfile(f):
+            # list each directory once instead of checking each file
+            names = {}  # directory -> names of the files in it
+            missing = []
+            for f in input_files:
+                dirname, basename = os.path.split(f)
+                if dirname not in names:
+                    try:
+                        names[dirname] = set(os.listdir(dirname or os.curdir))
+                    except OSError:
+                        names[dirname] = set()
+                # the listing also has folders, which are not frames:
+                if basename not in names[dirname] or not os.path.isfile(f):
+                    missing.append(f)
+            for f in missing:
                 print 'Input file %s does not exist.' % f
-                error_encountered = True
-        if error_encountered:
-            raise IOError('Some input files were not found.')
+            if missing:
+                raise IOError('Some input files were not found.')
 
         fname, ext = os.path.splitext(file_)
         if not ext:
@@ -141,6 +311,10 @@ class MovieEncoder(object):
             print "\n\nmovie in output file", outf
             return
 
+        if self._prop['stream'] and encoder in ('ffmpeg', 'avconv'):
+            self._stream()
+            return
+
         # Get command string (all other encoders are run as stand-alone apps)
         exec('cmd=self._%s()' % encoder)
 
@@ -155,95 +329,162 @@ class MovieEncoder(object):
             print "\n\nmovie in output file", self._prop['output_file']
 
         # Clean up temporary files
-        if self._prop['cleanup'] and hasattr(self, '_tmp_files'):
-            for tmp_file in self._tmp_files:
-                os.remove(tmp_file)
+        if self._prop['cleanup'] and self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, True)
+            self._tmp_dir = None
+
+    def _tmp_prefix(self):
+        """Return the prefix for temporary files. The files are made in a
+        new folder in the current directory, which is removed after
+        encoding, so movies made at the same time in the same directory
+        do not use the same temporary files.
+        """
+        if self._tmp_dir is None:
+            self._tmp_dir = tempfile.mkdtemp(prefix='tmp_easyviz_',
+                                             dir=os.curdir)
+        return os.path.join(self._tmp_dir, 'tmp_easyviz_')
+
+    def _threads(self):
+        """Return the number of threads the encoder should use."""
+        threads = self._prop['threads']
+        if threads is None:
+            threads = _cpu_count()
+        return max(1, int(threads))
+
+    # printf-style file specification, e.g., frame%04d.png:
+    _printf_pattern = re.compile(r'(.*)%(\d+)d(.*\..*)')
+
+    def _expand_pattern(self, files):
+        """Return a sorted list of the files matching files, given either
+        as a printf-style specification (frame%04d.png) or as a Unix
+        wildcard (frame*.png).
+        """
+        match = self._printf_pattern.search(files)
+        if match:
+            pre, num, ext = match.groups()
+            files = pre + '[0-9]'*int(num) + ext
+        files = glob.glob(files)
+        files.sort()
+        return files
+
+    def _input_files(self):
+        """Return the list of input files (printf-style specifications
+        and wildcards are expanded). Raise an exception if it is empty."""
+        files = self._prop['input_files']
+        if isinstance(files, str):
+            files = self._expand_pattern(files)
+        if not files:
+            raise ValueError(
+                "'%s' is not a valid file specification or the files " \
+                "does not exist." % self._prop['input_files'])
+        return files
+
+    def _output_file(self, default, ext=None):
+        """Return the name of the movie file: output_file, or default if
+        no output_file was given, with the extension ext added if it is
+        missing. Raise an exception if the file exists and
+        overwrite_output is False.
+        """
+        output_file = self._prop['output_file']
+        if output_file is None:
+            output_file = default
+        if ext is not None and not output_file.endswith(ext):
+            output_file += ext
+        if os.path.isfile(output_file) and not self._prop['overwrite_output']:
+            raise Exception("Output file '%s' already exist. Use" \
+                            " 'overwrite_output=True' to overwrite the file." \
+                            % output_file)
+        self._prop['output_file'] = output_file
+        return output_file
+
+    def _stream(self):
+        """Decode the input files with PIL and write the frames directly
+        to ffmpeg or avconv (as movie_stream does), instead of converting
+        the files to temporary PNG files first.
+        """
+        if _Image is None:
+            raise ImportError("stream=True requires PIL "\
+                              "(the Python Imaging Library)")
+        import numpy as np
+        files = self._input_files()
+        size = self._get_size()
+
+        # frames of files that appear more than once are decoded once and
+        # kept until the last time they are used:
+        remaining = {}
+        for file_ in files:
+            remaining[file_] = remaining.get(file_, 0) + 1
+        decoded = {}
+
+        def frames():
+            for file_ in files:
+                remaining[file_] -= 1
+                if file_ in decoded:
+                    frame = decoded[file_]
+                else:
+                    img = _Image.open(file_)
+                    if img.mode != 'RGB':
+                        img = img.convert('RGB')
+                    if size is not None:
+                        img = img.resize(size, _Image.ANTIALIAS)
+                    frame = np.asarray(img)
+                if remaining[file_]:
+                    decoded[file_] = frame
+                else:
+                    decoded.pop(file_, None)
+                yield frame
+
+        movie_stream(frames(), output_file=self._output_file('movie.avi'),
+                     fps=self._prop['fps'], vcodec=self._prop['vcodec'],
+                     encoder=self._prop['encoder'],
+                     overwrite_output=self._prop['overwrite_output'],
+                     quiet=self._prop['quiet'], threads=self._threads())
 
     def _convert(self):
         """Return a string with commands for making a movie with the convert
         tool (from ImageMagick)."""
-        encoder = self._prop['encoder']
-        cmd = encoder
+        cmd = [self._prop['encoder']]
 
         # set number of frames per second:
-        #cmd += ' -delay 1x%s' % self._prop['fps']
-        cmd += ' -delay %d' % (1.0/self._prop['fps']*100)
+        #cmd.append('-delay 1x%s' % self._prop['fps'])
+        cmd.append('-delay %d' % (1.0/self._prop['fps']*100))
 
         # set size:
         size = self._get_size()
         if size is not None:
-            cmd += ' -scale %sx%s' % (size[0], size[1])
+            cmd.append('-scale %sx%s' % (size[0], size[1]))
 
         # get image files:
-        files = self._prop['input_files']
-        if isinstance(files, str):
-            pattern = r'(.*)%(\d+)d(.*\..*)'
-            match = re.search(pattern, files)
-            if match:
-                pre = match.group(1)
-                num = int(match.group(2))
-                ext = match.group(3)
-                files = pre + '[0-9]'*num + ext
-            files = glob.glob(files)
-            files.sort()
-        if not files:
-            raise ValueError(
-                "'%s' is not a valid file specification or the files " \
-                "does not exist." % files)
+        files = self._input_files()
         if isinstance(self._prop['input_files'], str):
-            cmd += ' ' + self._prop['input_files']
+            cmd.append(self._prop['input_files'])
         else:
-            cmd += ' %s' % (' '.join(files))
+            cmd.extend(files)
 
         # set output file:
-        if self._prop['output_file'] is None:
-            self._prop['output_file'] = 'movie.gif'
-        output_file = self._prop['output_file']
-        if output_file[-4:] != '.gif':
-            output_file += '.gif'
-        if os.path.isfile(output_file) and not self._prop['overwrite_output']:
-            raise Exception("Output file '%s' already exist. Use" \
-                            " 'overwrite_output=True' to overwrite the file." \
-                            % output_file)
-        cmd += ' %s' % output_file
+        cmd.append(self._output_file('movie.gif', ext='.gif'))
 
-        return cmd
+        return ' '.join(cmd)
 
     def _mencoder(self):
         """Return a string with commands for making a movie with the MEncoder
         tool.
         """
-        encoder = self._prop['encoder']
-        cmd = encoder
+        cmd = [self._prop['encoder']]
         file_type = self._prop['file_type']
-        files = self._prop['input_files']
-        if isinstance(files, str):
-            pattern = r'(.*)%(\d+)d(.*\..*)'
-            match = re.search(pattern, files)
-            if match:
-                pre = match.group(1)
-                num = int(match.group(2))
-                ext = match.group(3)
-                files = pre + '[0-9]'*num + ext
-            files = glob.glob(files)
-            files.sort()
-            if not files:
-                raise ValueError(
-                    "'%s' is not a valid file specification or the files "\
-                    "does not exist." % self._prop['input_files'])
+        files = self._input_files()
         if isinstance(files, (list,tuple)):
             if not file_type in ['jpg', 'png'] or \
                    self._prop['force_conversion']:
                 # since mencoder only supports jpg and png files, we have to
                 # create copies of the input files and convert them to jpg.
-                files = self._any2any(files, ofile_ext='.png')
+                files = self._any2any(files, basename=self._tmp_prefix(),
+                                      ofile_ext='.png')
                 file_type = 'png'
-                self._tmp_files = files[:] # store files for later removal
             # give the files as a comma separated string to mencoder:
             files = ','.join(files)
-        cmd += ' "mf://%s" -mf' % files
-        cmd += ' fps=%g' % float(self._prop['fps'])
-        cmd += ':type=%s' % file_type
+        cmd.append('"mf://%s" -mf' % files)
+        cmd.append('fps=%g:type=%s' % (float(self._prop['fps']), file_type))
         vbitrate = self._prop['vbitrate']
         if vbitrate is None:
             vbitrate = 800
@@ -253,108 +494,115 @@ class MovieEncoder(object):
         qmax = self._prop['qmax']
         vbuffer = self._prop['vbuffer']
         if vcodec == 'xvid':
-            cmd += ' -ovc xvid -xvidencopts'
+            cmd.append('-ovc xvid -xvidencopts')
             if qscale is not None:
-                cmd += ' fixed_quant=%s' % qscale
+                opts = ['fixed_quant=%s' % qscale]
             else:
-                cmd += ' bitrate=%s:' % vbitrate
-                cmd += 'min_iquant=%s:max_iquant=%s:' % (qmin, qmax)
-                cmd += 'min_pquant=%s:max_pquant=%s:' % (qmin, qmax)
-                cmd += 'min_bquant=%s:max_bquant=%s' % (qmin, qmax)
+                opts = ['bitrate=%s' % vbitrate]
+                for frame in 'ipb':
+                    opts.append('min_%squant=%s:max_%squant=%s' % \
+                                (frame, qmin, frame, qmax))
+            opts.append('threads=%d' % self._threads())
         else:
+            cmd.append('-ovc lavc -lavcopts')
             # mbd: macroblock decision
-            cmd += ' -ovc lavc -lavcopts vcodec=%s:mbd=1' % vcodec
+            opts = ['vcodec=%s' % vcodec, 'mbd=1']
             if vbitrate is not None:
-                cmd += ':vbitrate=%s' % vbitrate
-                #cmd += ':vrc_minrate=%s:vrc_maxrate=%s' % ((vbitrate,)*2)
+                opts.append('vbitrate=%s' % vbitrate)
+                #opts.append('vrc_minrate=%s:vrc_maxrate=%s' % ((vbitrate,)*2))
             if qscale is not None:
-                cmd += ':vqscale=%s' % qscale
+                opts.append('vqscale=%s' % qscale)
             else:
-                cmd += ':vqmin=%s:vqmax=%s' % (qmin, qmax)
+                opts.append('vqmin=%s:vqmax=%s' % (qmin, qmax))
             if vbuffer is not None:
-                cmd += ':vrc_buf_size=%s' % vbuffer
+                opts.append('vrc_buf_size=%s' % vbuffer)
+            # (libavcodec in MEncoder accepts at most 8 threads)
+            opts.append('threads=%d' % min(self._threads(), 8))
         aspect = self._prop['aspect']
         if aspect is not None:
-            cmd += ':aspect=%s' % aspect
-        #cmd += ' -oac copy' # audio
+            opts.append('aspect=%s' % aspect)
+        cmd.append(':'.join(opts))
+        #cmd.append('-oac copy') # audio
         size = self._get_size()
         if size is not None:
-            cmd += ' -vf scale=%s:%s' % (size[0], size[1])
-        # if no output file is given, use 'movie.avi' as default:
-        if self._prop['output_file'] is None:
-            self._prop['output_file'] = 'movie.avi'
-        output_file = self._prop['output_file']
-        if os.path.isfile(output_file) and not self._prop['overwrite_output']:
-            raise Exception("Output file '%s' already exist. Use" \
-                            " 'overwrite_output=True' to overwrite the file." \
-                            % output_file)
-        cmd += ' -o %s' % output_file
+            cmd.append('-vf scale=%s:%s' % (size[0], size[1]))
+        cmd.append('-o %s' % self._output_file('movie.avi'))
         if self._prop['quiet']:
-            cmd += ' > /dev/null 2>&1'
-        return cmd
+            cmd.append('> /dev/null 2>&1')
+        return ' '.join(cmd)
+
+    # ffmpeg options that are given only if the property is not None:
+    _ffmpeg_options = [('vcodec', '-vcodec %s'),
+                       ('aspect', '-aspect %s'),
+                       ('vbuffer', '-bufsize %s')]
+    # image file types that ffmpeg (and avconv) can read without help:
+    _ffmpeg_file_types = 'png jpg gif bmp tif tga pnm'.split()
 
     def _ffmpeg(self):
         """Return a string with commands for making a movie with the ffmpeg
         tool.
         """
-        encoder = self._prop['encoder']
-        cmd = encoder
+        cmd = [self._prop['encoder']]
         files = self._prop['input_files']
         file_type = self._prop['file_type']
         if isinstance(files, str):
-            pattern = r'(.*)%(\d+)d(.*\..*)'
-            match = re.search(pattern, files)
-            if match:
-                if file_type not in ['jpg', 'png'] or \
-                       self._prop['force_conversion']:
-                    pre = match.group(1)
-                    num = int(match.group(2))
-                    ext = match.group(3)
-                    files = pre + '[0-9]'*num + ext
-                    files = glob.glob(files)
-                    files.sort()
-            else:
-                files = glob.glob(files)
-                files.sort()
-        if isinstance(files, (list,tuple)):
-            basename = 'tmp_easyviz_'
+            # a printf-style specification can be passed on to the encoder
+            # unless the files must be converted first:
+            if not self._printf_pattern.search(files) or \
+                   file_type not in self._ffmpeg_file_types or \
+                   self._prop['force_conversion']:
+                files = self._expand_pattern(files)
+        if isinstance(files, (list,tuple)) and \
+               file_type in self._ffmpeg_file_types and \
+               not self._prop['force_conversion'] and \
+               len(set([os.path.splitext(name)[1] for name in files])) == 1:
+            # let the concat demuxer read the files in the given order
+            # instead of copying or converting them to a new sequence of
+            # files (the concat demuxer needs the same format in all files):
+            concat_file = self._tmp_prefix() + 'concat.txt'
+            f = open(concat_file, 'w')
+            f.writelines(["file '%s'\n" % \
+                          os.path.abspath(name).replace("'", "'\\''") \
+                          for name in files])
+            f.close()
+            cmd.append('-f concat -safe 0 -r %s' % self._prop['fps'])
+            files = concat_file
+        elif isinstance(files, (list,tuple)):
+            basename = self._tmp_prefix()
             files = self._any2any(files, basename=basename, ofile_ext='.png')
             file_type = 'png'
-            self._tmp_files = files[:]
             # create a new string with the right pattern:
             files = basename + '%04d.png'
-        cmd += ' -i "%s"' % files
+        cmd.append('-i "%s"' % files)
         vbitrate = self._prop['vbitrate']
         if vbitrate is None:
             vbitrate = "800k"
-        cmd += ' -b %s' % vbitrate
-        cmd += ' -r %s' % self._prop['fps']
+        cmd.append('-b %s' % vbitrate)
+        cmd.append('-r %s' % self._prop['fps'])
         size = self._get_size()
         if size is not None:
-            cmd += ' -s %sx%s' % size
-        if self._prop['vcodec'] is not None:
-            cmd += ' -vcodec %s' % self._prop['vcodec']
+            cmd.append('-s %sx%s' % (size[0], size[1]))
         if self._prop['overwrite_output']:
-            cmd += ' -y'
-        if self._prop['aspect'] is not None:
-            cmd += ' -aspect %s' % self._prop['aspect']
+            cmd.append('-y')
         if self._prop['qscale'] is not None:
-            cmd += ' -qscale %s' % self._prop['qscale']
+            cmd.append('-qscale %s' % self._prop['qscale'])
         else:
-            cmd += ' -qmin %s -qmax %s' % \
-                   (self._prop['qmin'], self._prop['qmax'])
-        if self._prop['vbuffer'] is not None:
-            cmd += ' -bufsize %s' % self._prop['vbuffer']
+            cmd.append('-qmin %s -qmax %s' % \
+                       (self._prop['qmin'], self._prop['qmax']))
+        for name, option in self._ffmpeg_options:
+            if self._prop[name] is not None:
+                cmd.append(option % self._prop[name])
         if self._prop['gop_size'] is not None:
-            cmd += ' -g %d' % int(self._prop['gop_size'])
-        #cmd += ' -target dvd'
-        # if no output file is given, use 'movie.avi' as default:
+            cmd.append('-g %d' % int(self._prop['gop_size']))
+        cmd.append('-threads %d' % self._threads())
+        #cmd.append('-target dvd')
+        # (ffmpeg itself asks before overwriting an existing file)
         if self._prop['output_file'] is None:
             self._prop['output_file'] = 'movie.avi'
-        cmd += ' ' + self._prop['output_file']
+        cmd.append(self._prop['output_file'])
         if self._prop['quiet']:
-            cmd += ' > /dev/null 2>&1'
-        return cmd
+            cmd.append('> /dev/null 2>&1')
+        return ' '.join(cmd)
 
     def _avconv(self):
         """avconv can use same command as ffmpeg."""
@@ -365,7 +613,7 @@ class MovieEncoder(object):
         mpeg_encode tool.
         """
         encoder = self._prop['encoder']
-        basename = 'tmp_easyviz_'  # basename for temporary files
+        basename = self._tmp_prefix()  # basename for temporary files
 
         # set frame rate:
         # mpeg_encode only supports a given set of frame rates:
@@ -388,44 +636,22 @@ class MovieEncoder(object):
                       (encoder, legal_aspects))
         else:
             aspect = 1.0
-        print aspect
 
         # get image files:
-        files = self._prop['input_files']
-        if isinstance(files, str):
-            pattern = r'(.*)%(\d+)d(.*\..*)'
-            match = re.search(pattern, files)
-            if match:
-                pre = match.group(1)
-                num = int(match.group(2))
-                ext = match.group(3)
-                files = pre + '[0-9]'*num + ext
-            files = glob.glob(files)
-            files.sort()
-        if not files:
-            raise ValueError(
-                "'%s' is not a valid file specification or the files " \
-                "does not exist." % files)
+        files = self._input_files()
         size = self._get_size()
         if size is not None or self._prop['file_type'] != 'pnm' or \
                self._prop['force_conversion']:
             files = self._any2any(files, basename=basename, size=size)
-            self._tmp_files = files[:]
-        files = '\n'.join(files)
 
-        # set input dir:
-        input_dir = os.path.split(files[0])[0]
+        # set input dir (the files are listed relative to it):
+        input_dir = os.path.dirname(files[0])
         if input_dir == '':
             input_dir = '.'
+        files = '\n'.join([os.path.basename(f) for f in files])
 
         # set output file:
-        if self._prop['output_file'] is None:
-            self._prop['output_file'] = 'movie.mpeg'
-        mpeg_file = self._prop['output_file']
-        if os.path.isfile(mpeg_file) and not self._prop['overwrite_output']:
-            raise Exception("Output file '%s' already exist. Use" \
-                            " 'overwrite_output=True' to overwrite the file." \
-                            % mpeg_file)
+        mpeg_file = self._output_file('movie.mpeg')
 
         # set pattern (sequence of I, P, and B frames):
         pattern = self._prop['pattern']
@@ -458,8 +684,7 @@ class MovieEncoder(object):
 
         # create an mpeg_encode parameter file:
         mpeg_encode_file = "%s.mpeg_encode-input" % basename
-        f = open(mpeg_encode_file, "w")
-        f.write("""
+        text = """
 PATTERN	         %(pattern)s
 OUTPUT           %(mpeg_file)s
 BASE_FILE_FORMAT PNM
@@ -483,21 +708,19 @@ REFERENCE_FRAME  ORIGINAL
 FRAME_RATE       %(fps)d
 ASPECT_RATIO     %(aspect)s
 FORCE_ENCODE_LAST_FRAME
-""" % vars())
+""" % vars()
 
         # set video bit rate and buffer size:
         vbitrate = self._prop['vbitrate']
         if isinstance(vbitrate, (float,int)):
-            f.write("BIT_RATE         %d" % (int(vbitrate)*1000))
+            text += "BIT_RATE         %d\n" % (int(vbitrate)*1000)
         vbuffer = self._prop['vbuffer']
         if isinstance(vbuffer, (float,int)):
-            f.write("BUFFER_SIZE      %d" % (int(vbuffer)*1000))
+            text += "BUFFER_SIZE      %d\n" % (int(vbuffer)*1000)
+        f = open(mpeg_encode_file, "w")
+        f.write(text)
         f.close()
 
-        if not hasattr(self, '_tmp_files'):
-            self._tmp_files = []
-        self._tmp_files.append(mpeg_encode_file)
-
         # create the command string:
         cmd = encoder
         if self._prop['quiet']:
@@ -520,73 +743,62 @@ FORCE_ENCODE_LAST_FRAME
         file_type = self._prop['file_type']
         files = self._prop['input_files']
         if isinstance(files, str):
-            pattern = r'(.*)%(\d+)d(.*\..*)'
-            match = re.search(pattern, files)
-            if match:
-                if file_type not in ['jpg', 'png'] or \
-                       self._prop['force_conversion']:
-                    pre = match.group(1)
-                    num = int(match.group(2))
-                    ext = match.group(3)
-                    files = pre + '[0-9]'*num + ext
-                    files = glob.glob(files)
-                    files.sort()
-            else:
-                files = glob.glob(files)
-                files.sort()
+            # a printf-style specification can be passed on to the encoder
+            # unless the files must be converted first:
+            if not self._printf_pattern.search(files) or \
+                   file_type not in ['jpg', 'png'] or \
+                   self._prop['force_conversion']:
+                files = self._expand_pattern(files)
         if isinstance(files, (list,tuple)):
-            basename = 'tmp_easyviz_'
+            basename = self._tmp_prefix()
             files = self._any2any(files, basename=basename, ofile_ext='.png')
             file_type = 'png'
-            self._tmp_files = files[:]
             # create a new string with the right pattern:
             files = basename + '%04d.png'
 
-        cmd = ''
-        if file_type == 'jpg' and findprograms(jpeg2yuv):
-            cmd += jpeg2yuv
-        elif findprograms(png2yuv):
-            cmd += png2yuv
+        if file_type == 'jpg' and _findprogram(jpeg2yuv):
+            cmd = [jpeg2yuv]
+        elif _findprogram(png2yuv):
+            cmd = [png2yuv]
         else:
             raise Exception("png2yuv or jpeg2yuv is not installed")
-        cmd += ' -f 25' # frame rate
-        cmd += ' -I p'  # interlacing mode: p = none / progressive
-        cmd += ' -j "%s"' % files # set image files
-        # find start image:
-        for i in xrange(9999):
-            if os.path.isfile(files % i):
-                cmd += ' -b %d' % i
-                break
+        cmd.append('-f 25') # frame rate
+        cmd.append('-I p')  # interlacing mode: p = none / progressive
+        cmd.append('-j "%s"' % files) # set image files
+        # find start image (one directory listing instead of testing every
+        # number until a file is found):
+        first = files % 0
+        if not os.path.isfile(first):
+            matches = self._expand_pattern(files)
+            first = matches and matches[0]
+        if first:
+            match = self._printf_pattern.search(files)
+            pre, ext = match.group(1), match.group(3)
+            cmd.append('-b %d' % int(first[len(pre):len(first)-len(ext)]))
         if self._prop['quiet']:
-            cmd += ' -v 0' # verbosity level 0
+            cmd.append('-v 0') # verbosity level 0
+        pipeline = [' '.join(cmd)]
 
         # set size of movie (by using the yuvscaler tool):
         size = self._get_size()
-        if size is not None and findprograms(yuvscaler):
+        if size is not None and _findprogram(yuvscaler):
             width, height = size
-            cmd += ' | %(yuvscaler)s -O SIZE_%(width)sx%(height)s' % vars()
+            pipeline.append('%(yuvscaler)s -O SIZE_%(width)sx%(height)s' % \
+                            vars())
 
-        # if no output file is given, use 'movie.avi' as default:
-        if self._prop['output_file'] is None:
-            self._prop['output_file'] = 'movie.mpeg'
-        output_file = self._prop['output_file']
-        if os.path.isfile(output_file) and not self._prop['overwrite_output']:
-            raise Exception("Output file '%s' already exist. Use" \
-                            " 'overwrite_output=True' to overwrite the file." \
-                            % output_file)
+        output_file = self._output_file('movie.mpeg')
 
-        cmd += ' | '
-        cmd += encoder
+        cmd = [encoder]
         if self._prop['vcodec'] == 'mpeg2video':
-            cmd += ' -f 3' # generic mpeg-2 video
+            cmd.append('-f 3') # generic mpeg-2 video
         else:
-            cmd += ' -f 0' # generic mpeg-1 video
+            cmd.append('-f 0') # generic mpeg-1 video
         if self._prop['vbitrate'] is not None:
-            cmd += ' -b %d' % int(self._prop['vbitrate'])
+            cmd.append('-b %d' % int(self._prop['vbitrate']))
         if self._prop['vbuffer'] is not None:
-            cmd += ' -V %d' % int(self._prop['vbuffer'])
+            cmd.append('-V %d' % int(self._prop['vbuffer']))
         if self._prop['qscale'] is not None:
-            cmd += ' -q %s' % self._prop['qscale']
+            cmd.append('-q %s' % self._prop['qscale'])
 
         # set movie frame rate:
         legal_fps = {'23.976': 1, '24': 2, '25': 3, '29.97': 4,
@@ -594,13 +806,14 @@ FORCE_ENCODE_LAST_FRAME
         fps = str(self._prop['fps'])
         if not fps in legal_fps:
             raise ValueError("fps must be %s, not %s" % \
-                             (fps_convert.keys(), fps))
-        cmd += ' -F %s' % legal_fps[fps]
-        #cmd += ' --cbr' # constant bit rate
+                             (legal_fps.keys(), fps))
+        cmd.append('-F %s' % legal_fps[fps])
+        #cmd.append('--cbr') # constant bit rate
+        cmd.append('-M %d' % self._threads()) # worker threads
         gop_size = self._prop['gop_size']
         if gop_size is not None:
             # set min (-g) and max (-G) gop size to the same value:
-            cmd += ' -g %s -G %s' % (gop_size, gop_size)
+            cmd.append('-g %s -G %s' % (gop_size, gop_size))
 
         # set aspect ratio:
         legal_aspects = {'1.0': 1, '1.3': 2, '1.7': 3, '2.21': 4}
@@ -616,13 +829,14 @@ FORCE_ENCODE_LAST_FRAME
                     raise ValueError(
                         "aspect must be either 1:1, 4:3, 16:9, or 2.21:1," \
                         " not '%s'" % aspect)
-            cmd += ' -a %s' % aspect
+            cmd.append('-a %s' % aspect)
 
         # set output file:
-        cmd += ' -o %s' % self._prop['output_file']
+        cmd.append('-o %s' % output_file)
         if self._prop['quiet']:
-            cmd += ' -v 0' # verbosity level 0 (warnings and errors only)
-        return cmd
+            cmd.append('-v 0') # verbosity level 0 (warnings and errors only)
+        pipeline.append(' '.join(cmd))
+        return ' | '.join(pipeline)
 
     def _any2any(self, files, basename='tmp_easyviz_',
                  size=None, ofile_ext='.pnm'):
@@ -642,6 +856,15 @@ FORCE_ENCODE_LAST_FRAME
                              }
         _check_type(files, 'files', (list,tuple))
         ifile_ext = os.path.splitext(files[0])[1]
+        ifile_exts = set([os.path.splitext(file_)[1] for file_ in files])
+        if ifile_exts == set([ofile_ext]) and size is None and \
+               not self._prop['force_conversion']:
+            # the files only need new names (for ffmpeg and mpeg2enc)
+            return self._link_files(files, basename)
+        if _Image is not None and ifile_exts <= set(self._pil_formats) and \
+               ofile_ext in self._pil_formats and \
+               self._prop['preferred_package'].lower() != 'netpbm':
+            return self._pil_convert(files, basename, size, ofile_ext)
         anytopnm = netpbm_converters[ifile_ext][0]
         pnmtoany = netpbm_converters[ofile_ext][1]
         pnmscale = 'pnmscale'
@@ -649,49 +872,69 @@ FORCE_ENCODE_LAST_FRAME
         convert = 'convert'
 
         app = anytopnm
-        if findprograms((convert, anytopnm, pnmtoany)):
+        if _findprogram(convert, anytopnm, pnmtoany):
             if self._prop['preferred_package'].lower() == 'imagemagick':
                 app = convert
-        elif findprograms(convert):
+        elif _findprogram(convert):
             app = convert
-        elif not findprograms((anytopnm, pnmtoany)):
+        elif not _findprogram(anytopnm, pnmtoany):
             raise Exception("Neither %s nor %s was found" % (convert,anytopnm))
 
         quiet = self._prop['quiet']
-        new_files = []
-        i = 1 # counter
-        for file_ in files:
-            new_file = "%s%04d%s" % (basename, i, ofile_ext)
+        scale = size is not None and _findprogram(pnmscale)
+        cmds = []
+        for i, file_ in enumerate(files):
+            new_file = "%s%04d%s" % (basename, i+1, ofile_ext)
             if app == anytopnm:
-                options = ''
+                argv = [app]
                 if quiet and app != 'cat':
-                    options += '-quiet'
+                    argv.append('-quiet')
                 if app == 'pstopnm':
-                    options += ' -stdout'
-                    #options += ' -portrait'
-                cmd = "%(app)s %(options)s %(file_)s " % vars()
-                if size is not None and findprograms(pnmscale):
+                    argv.append('-stdout')
+                    #argv.append('-portrait')
+                pipeline = [argv + [file_]]
+                if scale:
                     w, h = size
-                    cmd += "| %(pnmscale)s -width %(w)s -height %(h)s" % vars()
+                    pipeline.append([pnmscale, '-width', str(w),
+                                     '-height', str(h)])
                 if pnmtoany != '':
-                    options = ''
+                    argv = [pnmtoany]
                     if quiet:
-                        options += '-quiet'
+                        argv.append('-quiet')
                     if pnmtoany == 'pnmtojpeg':
-                        options += ' -quality 100' # don't lose quality
-                    cmd += " | %(pnmtoany)s %(options)s" % vars()
-                cmd += " > %s" % new_file
+                        argv += ['-quality', '100'] # don't lose quality
+                    pipeline.append(argv)
+                cmds.append((pipeline, new_file))
             else:
-                options = ''
+                argv = [app]
                 if size is not None:
-                    options += '-resize %sx%s' % size
-                cmd = "%(app)s %(options)s %(file_)s %(new_file)s" % vars()
+                    argv += ['-resize', '%sx%s' % tuple(size)]
+                cmds.append(([argv + [file_, new_file]], None))
+
+        # each file is converted by separate processes (no shell),
+        # run several conversions at once (a Netpbm pipeline is already
+        # one process per stage, so fewer of them are run at the same
+        # time by default):
+        nworkers = self._prop['nworkers']
+        if nworkers is None:
+            nworkers = max(1, _cpu_count()//len(cmds[0][0]))
+        failures = _run_commands(cmds, nworkers)
+
+        new_files = []
+        for i, (file_, cmd) in enumerate(zip(files, cmds)):
             if not quiet:
-                print cmd
-            failure = os.system(cmd)
-            if failure:
+                print _pipeline2str(*cmd)
+            new_file = "%s%04d%s" % (basename, i+1, ofile_ext)
+            if failures[i]:
                 print "... %s failed, jumping to next file..." % app
+                if os.path.isfile(new_file) and new_file not in files:
+                    os.remove(new_file)
                 continue
+            # the numbering must be without gaps for ffmpeg and mpeg2enc:
+            next_file = "%s%04d%s" % (basename, len(new_files)+1, ofile_ext)
+            if next_file != new_file:
+                os.rename(new_file, next_file)
+                new_file = next_file
             new_files.append(new_file)
             if not quiet:
                 apps = app
@@ -699,38 +942,126 @@ FORCE_ENCODE_LAST_FRAME
                     apps += ' and %s' % pnmtoany
                 print "%s transformed via %s to %s (%d Kb)" % \
                       (file_,apps,new_file,int(os.path.getsize(new_file)/1000))
-            i += 1
 
         return new_files
 
+    def _link_files(self, files, basename):
+        """Make links basename0001.ext, basename0002.ext, ... to files
+        (copies if symbolic links are not supported) and return them.
+        """
+        new_files = []
+        for i, file_ in enumerate(files):
+            ext = os.path.splitext(file_)[1]
+            new_file = "%s%04d%s" % (basename, i+1, ext)
+            if os.path.islink(new_file) or os.path.isfile(new_file):
+                os.remove(new_file)  # left by an earlier run
+            if hasattr(os, 'symlink'):
+                os.symlink(os.path.abspath(file_), new_file)
+            else:
+                shutil.copy(file_, new_file)
+            new_files.append(new_file)
+        if not self._prop['quiet']:
+            print "linked %s, ... to %s, ..." % (files[0], new_files[0])
+        return new_files
+
+    # file types that PIL can both read and write (PostScript needs
+    # Ghostscript and is left to Netpbm or ImageMagick):
+    _pil_formats = {'.png': 'PNG', '.gif': 'GIF', '.jpg': 'JPEG',
+                    '.jpeg': 'JPEG', '.bmp': 'BMP', '.tif': 'TIFF',
+                    '.tiff': 'TIFF', '.pnm': 'PPM'}
+
+    def _pil_convert(self, files, basename, size, ofile_ext):
+        """As _any2any, but the files are converted by the Python Imaging
+        Library (no external programs are run). Several files are
+        converted at the same time in separate processes (nworkers of
+        them, default: the number of CPUs).
+        """
+        import multiprocessing
+        quiet = self._prop['quiet']
+        # convert each distinct file once, repeated frames are copied:
+        jobs = []
+        index = {}  # input file -> number in jobs
+        for file_ in files:
+            if file_ not in index:
+                index[file_] = len(jobs)
+                jobs.append((file_, "%spil%04d%s" % \
+                             (basename, len(jobs)+1, ofile_ext),
+                             size, self._pil_formats[ofile_ext]))
+        nworkers = self._prop['nworkers']
+        if nworkers is None:
+            nworkers = _cpu_count()
+        nworkers = min(nworkers, len(jobs))
+        if nworkers > 1 and not multiprocessing.current_process().daemon:
+            # (processes in a movies() pool cannot start their own pool)
+            pool = multiprocessing.Pool(nworkers)
+            try:
+                errors = pool.map(_pil_save, jobs)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            errors = map(_pil_save, jobs)
+
+        new_files = []
+        converted = {}  # input file -> first converted copy
+        for file_ in files:
+            k = index[file_]
+            if errors[k] is not None:
+                print "... PIL could not convert %s (%s), jumping to " \
+                      "next file..." % (file_, errors[k])
+                continue
+            # the numbering must be without gaps for ffmpeg and mpeg2enc:
+            new_file = "%s%04d%s" % (basename, len(new_files)+1, ofile_ext)
+            new_files.append(new_file)
+            if file_ in converted:
+                # repeated frame: copy the result instead of converting again
+                shutil.copyfile(converted[file_], new_file)
+                continue
+            os.rename(jobs[k][1], new_file)
+            converted[file_] = new_file
+            if not quiet:
+                print "%s transformed via PIL to %s (%d Kb)" % \
+                      (file_, new_file, int(os.path.getsize(new_file)/1000))
+        return new_files
+
     def _get_aspect_ratio(self):
+        """Return the aspect ratio (parsed in the constructor)."""
+        return self._aspect
+
+    def _get_size(self):
+        """Return the size (parsed in the constructor)."""
+        return self._size
+
+    @staticmethod
+    def _parse_aspect_ratio(aspect):
         """Parse and return the aspect ratio."""
         # accept aspect ratio on the form 4:3, 4/3, or 1.3333
-        aspect = self._prop['aspect']
         if isinstance(aspect, str):
-            if aspect.find(':') > 0:
-                aspect = aspect.split(':')
-            elif aspect.find('/'):
-                aspect = aspect.split('/')
+            for sep in ':/':
+                if aspect.find(sep) > 0:
+                    aspect = aspect.split(sep)
+                    try: aspect = float(aspect[0]) / float(aspect[1])
+                    except: aspect = None
+                    break
             else:
                 try: aspect = float(aspect)
                 except: aspect = None
-            try: aspect = float(aspect[0]) / float(aspect[1])
-            except: aspect = None
         return aspect
 
-    def _get_size(self):
+    _legal_sizes = {'sqcif': (128, 96),
+                    'qcif': (176, 144),
+                    'cif': (352, 288),
+                    '4cif': (704, 576)}
+
+    @classmethod
+    def _parse_size(cls, size):
         """Parse and return the size."""
-        legal_sizes = {'sqcif': (128, 96),
-                       'qcif': (176, 144),
-                       'cif': (352, 288),
-                       '4cif': (704, 576)}
-        size = self._prop['size']
         if isinstance(size, str):
-            if size in legal_sizes:
-                size = legal_sizes[size]
+            if size in cls._legal_sizes:
+                size = cls._legal_sizes[size]
             else:
-                size = size.split('x') # wxh
+                try: size = tuple([int(n) for n in size.split('x')]) # wxh
+                except ValueError: size = None
         if not (isinstance(size, (tuple,list)) and len(size) == 2):
             size = None
         return size
@@ -941,14 +1272,20 @@ def movie(input_files, **kwargs):
     machine in question (unless it is specified as a keyword argument
     to the movie function).
 
-    Suppose we have some image files named `image_0000.eps`, `image_0001.eps`,
-    `image_0002.eps`, ... Note that the zero-padding, obtained by the printf
+    Suppose we have some image files named `image_0000.png`, `image_0001.png`,
+    `image_0002.png`, ... Note that the zero-padding, obtained by the printf
     format `04d` in this case, ensures that the files are listed in correct
-    numeric order when using a wildcard notation like `image_*.eps`.
+    numeric order when using a wildcard notation like `image_*.png`.
     We want to make a movie out of these files, where each file constitutes
     a frame in the movie. This task can be accomplished by the simple call::
 
-        movie('image_*.eps')
+        movie('image_*.png')
+
+    PNG files are the best choice for the frames: they can be read
+    directly by the encoding tools, while PostScript files (e.g.,
+    `image_*.eps`) must first be rasterized and converted, one file at a
+    time, which can take much longer than making the movie itself.
+    Use EPS frames only if the frames are also needed as vector graphics.
 
     The result is a movie file with a default name such as `movie.html`,
     `movie.avi`, `movie.mpeg`, or `movie.gif`, depending on the
@@ -959,7 +1296,7 @@ def movie(input_files, **kwargs):
     Note: We strongly recommend to always clean up previously generated
     files for the frames in movies::
 
-        for f in glob.glob('image_*.eps'):
+        for f in glob.glob('image_*.png'):
             os.remove(f)
 
     Otherwise, there is a danger of mixing old and new files in the movie!
@@ -968,7 +1305,7 @@ def movie(input_files, **kwargs):
     specify the encoder. For example, an animated GIF movie can be
     created by::
 
-        movie('image_*.eps', encoder='convert',
+        movie('image_*.png', encoder='convert',
               output_file='../wave2D.gif')
 
     The encoder here is the convert program from the ImageMagick suite
@@ -986,7 +1323,7 @@ def movie(input_files, **kwargs):
     If you want to create an MPEG movie by using the MEncoder
     tool, you can do this with the following command::
 
-        movie('image_*.eps', encoder='mencoder',
+        movie('image_*.png', encoder='mencoder',
               output_file='/home/johannr/wave2D.mpeg',
               vcodec='mpeg2video', vbitrate=2400, qscale=4, fps=10)
 
@@ -1009,7 +1346,9 @@ def movie(input_files, **kwargs):
     input_files: Specifies the image files which will be used to make the
     movie. The argument must be given either as a string,
     e.g., 'image_*.png' or a list/tuple of strings, e.g.,
-    glob.glob('image_*.png').
+    glob.glob('image_*.png'). A list of the filenames collected
+    while making the frames gives the frames in exactly that order
+    and avoids searching the directory for matching files.
 
     Notes:
 
@@ -1024,14 +1363,16 @@ def movie(input_files, **kwargs):
 
           Example of a correct description of the input files
           is image_%04d.png. If the input files are not given on
-          the correct format, there will automatically be made
-          copies of these files which will then be renamed to the
-          required filename format.
+          the correct format, Mpeg2enc gets links to the files
+          with the required filename format, while ffmpeg reads a
+          list of the file names (no copies are made).
 
-        * MEncoder, ffmpeg, and Mpeg2enc supports only .jpg and
-          .png image files. So, if the input files are on another
-          format, there will automatically be made copies which
-          in turn will be converted to the correct format.
+        * MEncoder and Mpeg2enc support only .jpg and .png image
+          files, and ffmpeg does not read .ps and .eps files. So, if
+          the input files are on another format, there will
+          automatically be made copies which in turn will be
+          converted to the correct format (or, with stream=True for
+          ffmpeg, decoded by PIL and written directly to ffmpeg).
 
     Optional arguments:
 
@@ -1181,7 +1522,9 @@ def movie(input_files, **kwargs):
     preferred_package: Sets whether to prefer the Netpbm package or the
     ImageMagick package if both of them are installed. Must be
     given as a string, i.e, either 'imagemagick' (default) or
-    'netpbm'.
+    'netpbm'. If the Python Imaging Library (PIL) is installed, it is
+    used instead of both for converting between PNG, GIF, JPEG, BMP,
+    TIFF, and PNM files, unless preferred_package is 'netpbm'.
 
     Notes:
 
@@ -1201,12 +1544,36 @@ def movie(input_files, **kwargs):
     cleanup: If True (default), all temporary files that are created
     during the execution of the movie command will be deleted.
 
+    remove_frames: If True, and the input files are in a folder made by
+    begin_movie_session, that folder and the input files are removed
+    in the background when the movie is successfully made. Give this
+    option to the last movie made from the folder. The default is
+    False.
+
     force_conversion: Forces conversion of images. This is a hack that can
     be used if the encoding tool has problems reading the input
     image files. If this is set to True, the images will be
     converted even if they are in a format recognized by the
     encoding tool. The default is False.
 
+    nworkers: The number of image files that are converted at the same
+    time when the encoding tool needs the frames in another file
+    format (e.g., EPS files given to ffmpeg). The default is the
+    number of CPUs on the machine (divided by the number of processes
+    in each conversion if Netpbm pipelines are used).
+
+    threads: The number of threads used by the encoder itself (the
+    -threads option of ffmpeg/avconv, threads in the MEncoder codec
+    options, and -M in Mpeg2enc). The default is the number of CPUs on
+    the machine. The convert and mpeg_encode tools ignore this option.
+
+    stream: If True, and the encoder is ffmpeg or avconv (preferred
+    when no encoder is given), each image file is read by PIL and the
+    frames are written directly to the encoder (see movie_stream), so
+    no temporary image files are made even if the files are not PNG
+    or JPEG files. Only output_file, fps, vcodec, size, quiet, and
+    overwrite_output are used by this method. The default is False.
+
     Known issues:
 
       * JPEG images created by the Vtk backend does not seem to work with
@@ -1217,8 +1584,210 @@ def movie(input_files, **kwargs):
 
       * Aspect ratio in mpeg_encode does not seem to work.
     """
+    _file_writer.flush()  # hardcopies saved in the background must be done
     me = MovieEncoder(input_files, **kwargs)
     me.encode()
+    if me._prop['remove_frames'] and me._prop['encoder'] != 'html':
+        _remove_movie_session(input_files, me._prop['output_file'])
+
+
+def _one_movie(job):
+    """Make the movie in a process started by movies. Return the name
+    of the movie file and whether the input files are to be removed."""
+    job = dict(job)
+    job.setdefault('nworkers', 1)  # the processes already use the CPUs
+    job.setdefault('threads', 1)
+    me = MovieEncoder(job.pop('input_files'), **job)
+    me.encode()
+    return me._prop['output_file'], \
+           me._prop['remove_frames'] and me._prop['encoder'] != 'html'
+
+def movies(jobs_list, jobs=None):
+    """
+    Make several movies at the same time, with at most jobs (default:
+    the number of CPUs) encoders running at once. Each element in
+    jobs_list is a dictionary with the arguments to the movie function,
+    including input_files. Return a list with the names of the movie
+    files.
+
+    Example::
+
+        movies([dict(input_files='wave_*.png', output_file='wave.avi'),
+                dict(input_files='heat_*.png', output_file='heat.avi')])
+
+    Since each movie is made in a separate process, the frames of a
+    movie are converted one at a time (nworkers=1), and each encoder
+    runs one thread (threads=1), unless these are given. Encoders that
+    use a graphics card (e.g., ffmpeg with NVENC) may not run faster in
+    parallel.
+    """
+    import multiprocessing
+    _file_writer.flush()  # hardcopies saved in the background must be done
+    if jobs is None:
+        jobs = _cpu_count()
+    pool = multiprocessing.Pool(max(1, min(jobs, len(jobs_list))))
+    try:
+        results = pool.map(_one_movie, jobs_list)
+    finally:
+        pool.close()
+        pool.join()
+    # folders from begin_movie_session are registered in this process:
+    for job, (output_file, remove_frames) in zip(jobs_list, results):
+        if remove_frames:
+            _remove_movie_session(job['input_files'], output_file)
+    return [output_file for output_file, remove_frames in results]
+
+
+_movie_sessions = []  # folders made by begin_movie_session
+
+def begin_movie_session(base=None):
+    """
+    Make a new, empty folder in the folder base (default: the current
+    working directory) for the plot files
+    of a movie and return its name. The name is unique for each call
+    (frames_<process id>_<time in microseconds>), so there is no need
+    to remove plot files from an earlier run before new ones are made.
+    The folder is kept, so several movies can be made from the same
+    plot files. Give remove_frames=True to the last movie call to have
+    the folder and the plot files removed in the background when the
+    movie file is made::
+
+        frames = begin_movie_session()
+        for i in range(len(t)):
+            plot(x, u[i], savefig=os.path.join(frames, 'tmp%04d.png' % i))
+        movie(os.path.join(frames, 'tmp*.png'), output_file='movie.gif')
+        movie(os.path.join(frames, 'tmp*.png'), output_file='movie.avi',
+              remove_frames=True)
+    """
+    subdir = 'frames_%d_%d' % (os.getpid(), int(time.time()*1E+6))
+    if base is not None:
+        subdir = os.path.join(base, subdir)
+    os.makedirs(subdir)
+    _movie_sessions.append(os.path.abspath(subdir))
+    return subdir
+
+def _remove_movie_session(input_files, output_file):
+    """Remove the folder with input_files if it was made by
+    begin_movie_session and does not contain output_file or the
+    current working directory."""
+    if isinstance(input_files, basestring):
+        input_files = [input_files]
+    folders = set([os.path.abspath(os.path.dirname(f)) for f in input_files])
+    if len(folders) != 1:
+        return
+    subdir = folders.pop()
+    if subdir not in _movie_sessions:
+        return
+    for name in output_file, os.curdir:
+        if os.path.abspath(name).startswith(subdir + os.sep) or \
+           os.path.abspath(name) == subdir:
+            return
+    _movie_sessions.remove(subdir)
+    # not a daemon thread: the files are removed also if the program ends
+    threading.Thread(target=shutil.rmtree, args=(subdir, True)).start()
+
+
+def movie_stream(frames, output_file='movie.avi', fps=25, vcodec='mpeg4',
+                 encoder='ffmpeg', overwrite_output=True, quiet=False,
+                 threads=None):
+    """
+    Make a movie from frames that are produced on the fly, without
+    storing each frame in an image file first. The frames are written
+    as raw RGB data, one frame after the other, to the standard input
+    of ffmpeg (or avconv), which encodes the movie in output_file.
+
+    frames: An iterable (list, generator, ...) where each element is
+    either a Matplotlib figure or an array of shape (height, width, 3)
+    with RGB values from 0 to 255 (uint8). A figure is drawn and its
+    canvas is used as the frame. All frames must have the same size.
+    Since the frames are encoded as they are produced, a generator
+    that updates the plot and yields the figure keeps only one frame
+    in memory at a time.
+
+    output_file, fps, vcodec, and threads have the same meaning as in
+    the movie function. With quiet=True the output from the encoder is
+    hidden.
+
+    Example on making a movie with the Matplotlib backend::
+
+        from scitools.std import *
+        x = linspace(0, 2*pi, 101)
+        def frames():
+            fig = get_backend().gcf()
+            for t in linspace(0, 1, 50):
+                plot(x, sin(x - 2*pi*t), axis=[0, 2*pi, -1, 1])
+                yield fig
+
+        movie_stream(frames(), output_file='wave.avi', fps=10)
+    """
+    import subprocess
+    import numpy as np
+
+    if encoder not in ('ffmpeg', 'avconv'):
+        raise ValueError("encoder must be 'ffmpeg' or 'avconv', not '%s'" %
+                         encoder)
+    if not _findprogram(encoder):
+        raise Exception("The selected encoder (%s) is not installed" % encoder)
+    if os.path.isfile(output_file) and not overwrite_output:
+        raise Exception("Output file '%s' already exist. Use" \
+                        " 'overwrite_output=True' to overwrite the file." \
+                        % output_file)
+
+    def rgb(frame):
+        if hasattr(frame, 'canvas'):  # Matplotlib figure
+            canvas = frame.canvas
+            canvas.draw()
+            w, h = canvas.get_width_height()
+            return np.fromstring(canvas.tostring_rgb(),
+                                 dtype=np.uint8).reshape(h, w, 3)
+        frame = np.asarray(frame)
+        if frame.ndim != 3 or frame.shape[2] != 3:
+            raise ValueError("frames must be RGB arrays of shape "\
+                             "(height, width, 3), not %s" % (frame.shape,))
+        return np.ascontiguousarray(frame, dtype=np.uint8)
+
+    proc = None
+    size = None
+    devnull = open(os.devnull, 'w')
+    try:
+        for frame in frames:
+            frame = rgb(frame)
+            if proc is None:
+                size = frame.shape
+                cmd = [encoder, '-y', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+                       '-s', '%dx%d' % (size[1], size[0]), '-r', str(fps),
+                       '-i', '-', '-vcodec', vcodec,
+                       '-threads', str(threads or _cpu_count()), output_file]
+                if not quiet:
+                    print "\nscitools.easyviz.movie_stream runs the "\
+                          "command: \n\n%s\n" % ' '.join(cmd)
+                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                        stdout=quiet and devnull or None,
+                                        stderr=quiet and devnull or None,
+                                        bufsize=10*1024*1024)
+                _enlarge_pipe(proc.stdin.fileno(), 4*frame.nbytes)
+            elif frame.shape != size:
+                raise ValueError("all frames must have size %s, not %s" % \
+                                 (size[1::-1], frame.shape[1::-1]))
+            try:
+                proc.stdin.write(frame.tostring())
+            except IOError:
+                break  # the encoder has stopped, its exit status tells why
+    finally:
+        if proc is not None:
+            try:
+                proc.stdin.close()
+            except IOError:
+                pass
+            failure = proc.wait()
+        devnull.close()
+    if proc is None:
+        raise ValueError("no frames to make a movie of")
+    if failure:
+        print '\n\nscitools.easyviz.movie_stream could not make movie'
+        raise SystemError('Check error messages from the encoder in the terminal window')
+    elif not quiet:
+        print "\n\nmovie in output file", output_file
 
 
 if __name__ == '__main__':
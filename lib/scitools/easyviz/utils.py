@@ -1,8 +1,19 @@
 from scitools.numpyutils import zeros, ones, exp, reshape, ravel, \
-     ndgrid, seq, linspace, arctan2, sqrt, shape, log, sin, cos
+     ndgrid, seq, linspace, arctan2, sqrt, shape, log, sin, cos, hypot, \
+     absolute, subtract, multiply, divide
+
+_available_backends = None  # cached result of available_backends
 
 def available_backends():
-    """Return a list of the available backends."""
+    """
+    Return a list of the available backends. The backends are found
+    by trying to import each backend module, which is done only once:
+    later calls return the same list (call clear_backend_cache to
+    check again, e.g., after installing a new plotting package).
+    """
+    global _available_backends
+    if _available_backends is not None:
+        return list(_available_backends)
     import os
     from scitools.misc import check_if_module_exists
     files = os.listdir(os.path.dirname(__file__))
@@ -20,9 +31,21 @@ def available_backends():
         except:
             pass
             #print "You can't use the %s backend" % module
-    return available
-            
-    
+    _available_backends = available
+    return list(available)
+
+def clear_backend_cache():
+    """Make the next available_backends call check all backends again."""
+    global _available_backends
+    _available_backends = None
+
+def _ndgrid_linspace(*ranges):
+    """
+    Return ndgrid(linspace(*r1), linspace(*r2), ...) for the given
+    (start, stop, n) tuples r1, r2, ...
+    """
+    return ndgrid(*[linspace(*r) for r in ranges], sparse=False)
+
 def peaks(*args):
     # z = peaks()
     # z = peaks(n)
@@ -32,7 +55,7 @@ def peaks(*args):
     if nargs in (0,1):
         if nargs == 1:
             n = int(args[0])
-        x, y = ndgrid(linspace(-3,3,n),linspace(-3,3,n))
+        x, y = _ndgrid_linspace((-3,3,n), (-3,3,n))
     elif nargs == 2:
         x, y = args
     else:
@@ -40,40 +63,46 @@ def peaks(*args):
     return 3*(1-x)**2*exp(-x**2-(y+1)**2) \
            - 10*(x/5-x**3-y**5)*exp(-x**2-y**2) - 1/3*exp(-(x+1)**2-y**2)
 
+_flows = {}  # cache for flow() and flow(n)
+
 def flow(*args):
     # xx,yy,zz,vv = flow()
     # xx,yy,zz,vv = flow(n)
     # xx,yy,zz,vv = flow(xx,yy,zz)
-    if len(args) == 0:
-        xx, yy, zz = ndgrid(linspace(0.1, 10, 50),
-                            linspace(-3, 3, 25),
-                            linspace(-3, 3, 25),
-                            sparse=False)
-    elif len(args) == 1:
-        n = int(args[0])
-        xx, yy, zz = ndgrid(linspace(0.1, 10, 2*n),
-                            linspace(-3, 3, n),
-                            linspace(-3, 3, n),
-                            sparse=False)
+    # (the data from flow() and flow(n) are cached, copies are returned)
+    if len(args) in (0,1):
+        n = 25
+        if len(args) == 1:
+            n = int(args[0])
+        if n not in _flows:
+            if len(_flows) >= 4:
+                _flows.clear()
+            xx, yy, zz = _ndgrid_linspace((0.1, 10, 2*n), (-3, 3, n),
+                                          (-3, 3, n))
+            _flows[n] = flow(xx, yy, zz)
+        return tuple([a.copy() for a in _flows[n]])
     elif len(args) == 3:
         xx, yy, zz = args
     else:
         raise SyntaxError("Invalid number of arguments.")
     
-    # convert to spherical coordinates:
-    theta = arctan2(zz, yy)
-    phi = arctan2(xx, sqrt(yy**2 + zz**2))
-    r = sqrt(xx**2 + yy**2 + zz**2)
-
-    rv = 2/r*(3/(2-cos(phi))**2 - 1)
-    phiv = -2*sin(phi)/(2-cos(phi))/r
-    thetav = zeros(shape(r))
-
-    # convert back to cartesian coordinates:
-    xv = rv*cos(phiv)*cos(thetav)
-    yv = rv*cos(phiv)*sin(thetav)
-    zv = rv*sin(phiv)
-
-    vv = log(sqrt(xv**2 + yv**2 + zv**2))
+    # In spherical coordinates (r, phi, theta) the velocity has
+    # components rv = 2/r*(3/(2-cos(phi))**2 - 1),
+    # phiv = -2*sin(phi)/(2-cos(phi))/r, and thetav = 0, and
+    # vv = log(sqrt(xv**2 + yv**2 + zv**2)) for the cartesian components
+    # xv, yv, zv of (rv, phiv, thetav) simplifies to log(abs(rv)).
+    # With cos(phi) = sqrt(yy**2 + zz**2)/r, vv is computed in place
+    # in one array with no need for the angles:
+    vv = hypot(yy, zz)
+    r = hypot(xx, vv)
+    divide(vv, r, vv)         # cos(phi)
+    subtract(2, vv, vv)
+    multiply(vv, vv, vv)
+    divide(3, vv, vv)
+    vv -= 1
+    multiply(vv, 2, vv)
+    divide(vv, r, vv)         # rv
+    absolute(vv, vv)
+    log(vv, vv)
 
     return xx, yy, zz, vv
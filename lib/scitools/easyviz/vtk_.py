@@ -1,6 +1,6 @@
 from common import *
 from scitools.numpyutils import ravel, zeros, array, allclose, rank, \
-     meshgrid, newaxis
+     meshgrid, newaxis, float32
 from scitools.globaldata import DEBUG, VERBOSE
 from scitools.numpyutils import NumPy_dtype
 from scitools.misc import check_if_module_exists
@@ -19,6 +19,54 @@ try: import vtkTkRenderWidget
 except:
     from vtk.tk import vtkTkRenderWidget
 
+try:
+    from vtk.util.numpy_support import numpy_to_vtk
+except ImportError:
+    numpy_to_vtk = None  # old VTK, fill the arrays value by value
+
+def _vtk_points(x, y, z):
+    """Return a vtkPoints object with the points given by the flat
+    arrays x, y, and z."""
+    n = len(x)
+    points = vtk.vtkPoints()
+    if numpy_to_vtk is None:
+        points.SetNumberOfPoints(n)
+        for i in range(n):
+            points.SetPoint(i, x[i], y[i], z[i])
+    else:
+        # vtkPoints store single precision, convert once for all points
+        xyz = zeros((n,3), float32)
+        xyz[:,0] = x;  xyz[:,1] = y;  xyz[:,2] = z
+        points.SetData(numpy_to_vtk(xyz, deep=1))
+    return points
+
+def _vtk_float_array(*components):
+    """Return a vtkFloatArray with one tuple for each element in the flat
+    arrays given as arguments (one array for each component)."""
+    n, m = len(components[0]), len(components)
+    if numpy_to_vtk is None:
+        array = vtk.vtkFloatArray()
+        array.SetNumberOfComponents(m)
+        array.SetNumberOfTuples(n)
+        for i in range(n):
+            array.SetTuple(i, [c[i] for c in components])
+    else:
+        data = zeros((n,m), float32)
+        for k in range(m):
+            data[:,k] = components[k]
+        array = numpy_to_vtk(data, deep=1)
+    return array
+
+_luts = {}  # colormaps that are built element by element, see _copy_lut
+
+def _copy_lut(key):
+    """Return a new vtkLookupTable with the same colors as _luts[key].
+    Each call to a colormap function must give a separate table (the
+    mappers change its range), but the table values are computed once."""
+    lut = vtk.vtkLookupTable()
+    lut.DeepCopy(_luts[key])
+    return lut
+
 class VtkBackend(BaseClass):
     """Backend using VTK."""
 
@@ -509,6 +557,9 @@ class VtkBackend(BaseClass):
         iso = vtk.vtkContourFilter()
         iso.SetInput(sgrid)
         iso.SetValue(0, item.getp('isovalue'))
+        # the normals are computed from the surface by vtkPolyDataNormals
+        # below, computing them from the volume gradient also is wasted:
+        iso.ComputeNormalsOff()
         iso.Update()
         data = self._cut_data(iso)
         normals = vtk.vtkPolyDataNormals()
@@ -538,9 +589,6 @@ class VtkBackend(BaseClass):
         y = asarray(item.getp('ydata'))/dar[1]
         sgrid = vtk.vtkStructuredGrid()
         sgrid.SetDimensions(item.getp('dims'))
-        no_points = item.getp('numberofpoints')
-        points = vtk.vtkPoints()
-        points.SetNumberOfPoints(no_points)
         if vectors:
             if hasattr(item, 'scale_vectors'):
                 item.scale_vectors()
@@ -569,16 +617,10 @@ class VtkBackend(BaseClass):
                     if len(y) == nx:
                         y = ravel(y[:,newaxis]*ones((nx,ny)))
             u = ravel(u)
-            vectors = vtk.vtkFloatArray()
-            vectors.SetNumberOfTuples(no_points)
-            vectors.SetNumberOfComponents(3)
-            vectors.SetNumberOfValues(3*no_points)
             assert shape(x)==shape(y)==shape(z)==shape(u)==shape(v)==shape(w),\
                    "matrix dimensions must agree"
-            for i in range(no_points):
-                points.SetPoint(i, x[i], y[i], z[i])
-                vectors.SetTuple3(i, u[i], v[i], w[i])
-            points.Modified()
+            points = _vtk_points(x, y, z)
+            vectors = _vtk_float_array(u, v, w)
             sgrid.SetPoints(points)
             sgrid.GetPointData().SetVectors(vectors)
         else:
@@ -597,22 +639,16 @@ class VtkBackend(BaseClass):
             else:
                 if cdata is not None and cdata.shape == values.shape:
                     values = cdata
-            scalars = vtk.vtkFloatArray()
-            scalars.SetNumberOfTuples(no_points)
-            scalars.SetNumberOfComponents(1)
             nx, ny = shape(values)
             if not (shape(x) == shape(y) == (nx,ny)):
                 x, y = meshgrid(ravel(x), ravel(y),
                                 sparse=False, indexing=indexing)
             assert shape(x) == shape(y) == shape(z), \
                    "array dimensions must agree"
-            ind = 0
-            for j in range(ny):
-                for i in range(nx):
-                    points.SetPoint(ind, x[i,j], y[i,j], z[i,j])
-                    scalars.SetValue(ind, values[i,j])
-                    ind += 1
-            points.Modified()
+            # the point number runs fastest in the first index (order='F'):
+            points = _vtk_points(ravel(x, order='F'), ravel(y, order='F'),
+                                 ravel(z, order='F'))
+            scalars = _vtk_float_array(ravel(values, order='F'))
             sgrid.SetPoints(points)
             sgrid.GetPointData().SetScalars(scalars)
 
@@ -627,9 +663,6 @@ class VtkBackend(BaseClass):
         z = asarray(item.getp('zdata'))/dar[2]
         sgrid = vtk.vtkStructuredGrid()
         sgrid.SetDimensions(item.getp('dims'))
-        no_points = item.getp('numberofpoints')
-        points = vtk.vtkPoints()
-        points.SetNumberOfPoints(no_points)
         if vectors:
             u = asarray(item.getp('udata'))
             v = asarray(item.getp('vdata'))
@@ -642,26 +675,15 @@ class VtkBackend(BaseClass):
                    shape(u) == shape(v) == shape(w), \
                    "array dimensions must agree"
 
-            vectors = vtk.vtkFloatArray()
-            vectors.SetNumberOfTuples(no_points)
-            vectors.SetNumberOfComponents(3)
-            vectors.SetNumberOfValues(3*no_points)
-
-            ind = 0
-            for k in range(nz):
-                for j in range(ny):
-                    for i in range(nx):
-                        points.SetPoint(ind, x[i,j,k], y[i,j,k], z[i,j,k])
-                        vectors.SetTuple3(ind, u[i,j,k], v[i,j,k], w[i,j,k])
-                        ind += 1
-            points.Modified()
+            # the point number runs fastest in the first index (order='F'):
+            points = _vtk_points(ravel(x, order='F'), ravel(y, order='F'),
+                                 ravel(z, order='F'))
+            vectors = _vtk_float_array(ravel(u, order='F'),
+                                       ravel(v, order='F'),
+                                       ravel(w, order='F'))
             sgrid.SetPoints(points)
             sgrid.GetPointData().SetVectors(vectors)
         else:
-            scalars = vtk.vtkFloatArray()
-            scalars.SetNumberOfTuples(no_points)
-            scalars.SetNumberOfComponents(1)
-
             v = asarray(item.getp('vdata'))
             # TODO: what about pseudocolor data?
             #cdata = ravel(item.getp('cdata'))
@@ -673,14 +695,10 @@ class VtkBackend(BaseClass):
                                    sparse=False, indexing=indexing)
             assert shape(x) == shape(y) == shape(z) == shape(v), \
                    "array dimensions must agree"
-            ind = 0
-            for k in range(nz):
-                for j in range(ny):
-                    for i in range(nx):
-                        points.SetPoint(ind, x[i,j,k], y[i,j,k], z[i,j,k])
-                        scalars.SetValue(ind, v[i,j,k])
-                        ind += 1
-            points.Modified()
+            # the point number runs fastest in the first index (order='F'):
+            points = _vtk_points(ravel(x, order='F'), ravel(y, order='F'),
+                                 ravel(z, order='F'))
+            scalars = _vtk_float_array(ravel(v, order='F'))
             sgrid.SetPoints(points)
             sgrid.GetPointData().SetScalars(scalars)
 
@@ -1403,25 +1421,27 @@ class VtkBackend(BaseClass):
         return lut
 
     def hot(self, m=256):
-        lut = vtk.vtkLookupTable()
-        inc = 0.01175
-        lut.SetNumberOfColors(256)
-        i = 0
-        r = 0.0; g = 0.0; b = 0.0
-        while r <= 1.:
-            lut.SetTableValue(i, r, g, b, 1)
-            r += inc;  i += 1
-        r = 1.
-        while g <= 1.:
-            lut.SetTableValue(i, r, g, b, 1)
-            g += inc;  i += 1
-        g = 1.
-        while b <= 1:
-            if i == 256: break
-            lut.SetTableValue(i, r, g, b, 1)
-            b += inc;  i += 1
-        lut.Build()
-        return lut
+        if ('hot', m) not in _luts:
+            lut = vtk.vtkLookupTable()
+            inc = 0.01175
+            lut.SetNumberOfColors(256)
+            i = 0
+            r = 0.0; g = 0.0; b = 0.0
+            while r <= 1.:
+                lut.SetTableValue(i, r, g, b, 1)
+                r += inc;  i += 1
+            r = 1.
+            while g <= 1.:
+                lut.SetTableValue(i, r, g, b, 1)
+                g += inc;  i += 1
+            g = 1.
+            while b <= 1:
+                if i == 256: break
+                lut.SetTableValue(i, r, g, b, 1)
+                b += inc;  i += 1
+            lut.Build()
+            _luts['hot', m] = lut
+        return _copy_lut(('hot', m))
 
     def flag(self, m=64):
         """Alternating red, white, blue, and black color map.
@@ -1429,17 +1449,19 @@ class VtkBackend(BaseClass):
         - flag(m)
           'm' must be a multiple of 4
         """
-        lut = vtk.vtkLookupTable()
-        lut.SetNumberOfColors(m)
-        # the last parameter alpha is set to 1 by default
-        # in method declaration
-        for i in range(0,m,4):
-            lut.SetTableValue(i,1,0,0,1)   # red
-            lut.SetTableValue(1+i,1,1,1,1) # white
-            lut.SetTableValue(2+i,0,0,1,1) # blue
-            lut.SetTableValue(3+i,0,0,0,1) # black
-        lut.Build()
-        return lut
+        if ('flag', m) not in _luts:
+            lut = vtk.vtkLookupTable()
+            lut.SetNumberOfColors(m)
+            # the last parameter alpha is set to 1 by default
+            # in method declaration
+            for i in range(0,m,4):
+                lut.SetTableValue(i,1,0,0,1)   # red
+                lut.SetTableValue(1+i,1,1,1,1) # white
+                lut.SetTableValue(2+i,0,0,1,1) # blue
+                lut.SetTableValue(3+i,0,0,0,1) # black
+            lut.Build()
+            _luts['flag', m] = lut
+        return _copy_lut(('flag', m))
 
     def jet(self, m=256):
         # blue, cyan, green, yellow, red, black
@@ -1450,22 +1472,24 @@ class VtkBackend(BaseClass):
         return lut
 
     def blue_to_yellow(self, m=200):
-        lut = vtk.vtkLookupTable()
-        lut.SetNumberOfColors(m)
-        for i in range(m):
-            frac = i / float(m / 2.0 - 1.0)
-            if (frac <= 1):
-                r = frac
-                g = r
-                b = 1
-            else:
-                r = 1
-                g = r
-                b = 2 - frac
-            # SetTableValue(indx, red, green, blue, alpha)
-            lut.SetTableValue(i, r, g, b, 1)
-        lut.Build()
-        return lut
+        if ('blue_to_yellow', m) not in _luts:
+            lut = vtk.vtkLookupTable()
+            lut.SetNumberOfColors(m)
+            for i in range(m):
+                frac = i / float(m / 2.0 - 1.0)
+                if (frac <= 1):
+                    r = frac
+                    g = r
+                    b = 1
+                else:
+                    r = 1
+                    g = r
+                    b = 2 - frac
+                # SetTableValue(indx, red, green, blue, alpha)
+                lut.SetTableValue(i, r, g, b, 1)
+            lut.Build()
+            _luts['blue_to_yellow', m] = lut
+        return _copy_lut(('blue_to_yellow', m))
 
     def spring(self, m=256):
         lut = vtk.vtkLookupTable()
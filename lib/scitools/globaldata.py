@@ -4,16 +4,15 @@ in the scitools package, loaded from a configuration file.
 (This module also demonstrate how to work with global parameters
 accross a package in Python.)
 
-The default configuration file looks like this:
-
+The default configuration file is scitools.cfg in the directory
+where this module resides.
 """
 
 __all__ = ['SAFECODE', 'VERBOSE', 'DEBUG', 'OPTIMIZATION', 'backend']
-__doc__ = __doc__ % ', '.join(__all__)
+if __doc__ is not None:  # None if python -OO
+    __doc__ = __doc__ % ', '.join(__all__)
 
-# Add the configuration file to the doc string of this module
 import os
-__doc__ += open(os.path.join(os.path.dirname(__file__), 'scitools.cfg')).read()
 
 
 if hasattr(__name__, 'VERBOSE'):  # test if we have global data present...
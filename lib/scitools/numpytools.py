@@ -879,6 +879,16 @@ def ndgrid(*args,**kwargs):
     """
     Same as calling ``meshgrid`` with *indexing* = ``'ij'`` (see
     ``meshgrid`` for documentation).
+
+    With sparse=True the coordinate arrays get shapes (nx,1) and
+    (1,ny) instead of (nx,ny), and expressions like
+    ``sin(sqrt(xv*xv + yv*yv))`` still give the full (nx,ny) array
+    of function values through broadcasting:
+
+    >>> x = linspace(0, 1, 3); y = linspace(0, 1, 2)
+    >>> xv, yv = ndgrid(x, y, sparse=True)
+    >>> xv.shape, yv.shape, (xv + yv).shape
+    ((3, 1), (1, 2), (3, 2))
     """
     kwargs['indexing'] = 'ij'
     return meshgrid(*args,**kwargs)
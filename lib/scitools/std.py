@@ -13,7 +13,9 @@ Easyviz plotting tool. The latter import statement performs::
   from numpy import *    
   from scitools.numpyutils import *  # some convenience functions
   from numpy.lib.scimath import *
-  from scipy import *                # if scipy is installed
+  from scipy import *                # if scipy is installed and wanted
+                                     # (otherwise scipy is imported
+                                     # on first use of scipy.<name>)
   import sys, operator, math
   from scitools.StringFunction import StringFunction
   from glob import glob
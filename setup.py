@@ -96,7 +96,7 @@ setup(
                 os.path.join("scitools", "easyviz"),
                 os.path.join("scitools", "pyreport"),
 		],
-    package_data = {'': ['scitools.cfg']},
+    package_data = {'': ['scitools.cfg', '_tutorial.rst']},
     scripts = scripts,
     data_files=[(os.path.join("share", "man", "man1"),
                  [os.path.join("doc", "man", "man1", "scitools.1.gz"),])],
@@ -0,0 +1,205 @@
+import os, shutil, tempfile, threading, time
+from scitools.easyviz.misc import _BackgroundFileWriter, _file_writer
+
+def _is_complete_png(filename):
+    data = open(filename, 'rb').read()
+    return data.startswith('\x89PNG\r\n\x1a\n') and \
+           data[-12:-4] == '\x00\x00\x00\x00IEND'
+
+def test_background_hardcopy():
+    from scitools.easyviz import setp, plot, hardcopy
+    tmpdir = tempfile.mkdtemp()
+    try:
+        setp(show=False)
+        plot([1, 2, 3], [1, 4, 9])
+        filename = os.path.join(tmpdir, 'tmp_background.png')
+        hardcopy(filename, background=True)
+        _file_writer.flush()
+        # the whole file is on disk when flush returns:
+        assert _is_complete_png(filename)
+        # the extension is added as in savefig:
+        hardcopy(os.path.join(tmpdir, 'tmp_noext'), background=True)
+        _file_writer.flush()
+        assert _is_complete_png(os.path.join(tmpdir, 'tmp_noext.png'))
+    finally:
+        shutil.rmtree(tmpdir)
+
+def test_flush_hooks():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        writer = _BackgroundFileWriter()
+        calls = []
+        def hook1():
+            calls.append('hook1')
+        def hook2():
+            calls.append('hook2')
+        writer.add_flush_hook(hook1)
+        writer.add_flush_hook(hook2)
+        writer.add_flush_hook(hook1)  # added only once
+        filename = os.path.join(tmpdir, 'tmp_hooks.txt')
+        writer.write(filename, 'abc'*1000)
+        writer.flush()
+        # the hooks are called in the order they were added:
+        assert calls == ['hook1', 'hook2']
+        assert open(filename).read() == 'abc'*1000
+        writer.flush()
+        assert calls == ['hook1', 'hook2']*2
+    finally:
+        shutil.rmtree(tmpdir)
+
+def test_write_error():
+    writer = _BackgroundFileWriter()
+    writer.write(os.path.join('no', 'such', 'dir', 'tmp.txt'), 'abc')
+    try:
+        writer.flush()
+    except IOError:
+        pass
+    else:
+        assert False, 'flush did not report the failed file'
+    writer.flush()  # the error is reported once
+
+def test_full_queue_blocks():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        writer = _BackgroundFileWriter(maxsize=2)
+        # hold back the writer thread until the queue is full:
+        writer._thread = 'not started'
+        names = [os.path.join(tmpdir, 'tmp_%d.txt' % i) for i in range(3)]
+        writer.write(names[0], 'frame 0')
+        writer.write(names[1], 'frame 1')
+        third = threading.Thread(target=writer.write,
+                                 args=(names[2], 'frame 2'))
+        third.start()
+        time.sleep(0.2)
+        assert third.isAlive(), 'write did not wait for a full queue'
+        writer._thread = threading.Thread(target=writer._run)
+        writer._thread.setDaemon(True)
+        writer._thread.start()
+        third.join()
+        writer.flush()
+        # no frame is dropped:
+        for i, name in enumerate(names):
+            assert open(name).read() == 'frame %d' % i
+    finally:
+        shutil.rmtree(tmpdir)
+
+def test_flush_savefig():
+    from scitools.easyviz import setp, plot, savefig, flush_savefig
+    tmpdir = tempfile.mkdtemp()
+    try:
+        setp(show=False)
+        names = []
+        for i in range(6):  # more frames than the queue holds
+            plot([0, 1], [0, i])
+            names.append(os.path.join(tmpdir, 'tmp_frame%04d.png' % i))
+            savefig(names[-1], background=True)
+        flush_savefig()
+        for name in names:
+            assert _is_complete_png(name)
+    finally:
+        shutil.rmtree(tmpdir)
+
+def test_turn_off_plotting():
+    import scitools.easyviz
+    from scitools.easyviz import turn_off_plotting
+    namespace = dict(vars(scitools.easyviz))
+    turn_off_plotting(namespace)
+    # the plotting commands are accepted and do nothing:
+    namespace['plot']([1, 2], [3, 4], 'r-')
+    namespace['gca']().setp(xlabel='x')
+    with namespace['delay_redraw']():
+        namespace['subplot'](2, 1, 1)
+        namespace['title']('no plot')
+    # exceptions in the with block are not swallowed:
+    try:
+        with namespace['delay_redraw']():
+            raise ValueError('in with block')
+    except ValueError:
+        pass
+    else:
+        assert False, 'the exception was lost'
+
+def test_turn_off_plotting_one_object():
+    import scitools.easyviz
+    from scitools.easyviz import turn_off_plotting
+    namespace = dict(vars(scitools.easyviz))
+    turn_off_plotting(namespace)
+    # all the plotting commands are the same object, and so are the
+    # results of calls and attribute lookups (nothing is created):
+    plt = namespace['plt']
+    for name in 'plot', 'surf', 'figure', 'gca', 'hardcopy', 'savefig':
+        assert namespace[name] is plt
+    assert namespace['gca']().setp(xlabel='x') is plt
+    assert namespace['figure']().axes is plt
+    assert list(namespace['plot']([1, 2], [3, 4])) == []
+    # a second call gives the same object again:
+    namespace2 = dict(vars(scitools.easyviz))
+    turn_off_plotting(namespace2)
+    assert namespace2['plt'] is plt
+
+# stand-in for gnuplot that is slow to finish hardcopy files:
+gnuplot_stub = """\
+#!/bin/sh
+out=
+prn=
+while read cmd what name; do
+    name=${name#\\"}
+    name=${name%\\"}
+    case "$cmd $what" in
+        "set output")
+            if [ -n "$name" ]; then
+                out=$name
+            elif [ -n "$out" ]; then
+                sleep 0.5
+                echo complete > "$out"
+                out=
+            fi;;
+        "set print")
+            prn=$name;;
+        print*)
+            echo done > "$prn";;
+        quit*)
+            exit 0;;
+    esac
+done
+"""
+
+def test_gnuplot_hardcopy_complete():
+    try:
+        import Gnuplot
+    except ImportError:
+        return  # the Gnuplot.py package is needed for this test
+    tmpdir = tempfile.mkdtemp()
+    gnuplot_command = Gnuplot.GnuplotOpts.gnuplot_command
+    try:
+        stub = os.path.join(tmpdir, 'gnuplot')
+        f = open(stub, 'w')
+        f.write(gnuplot_stub)
+        f.close()
+        os.chmod(stub, 0755)
+        Gnuplot.GnuplotOpts.gnuplot_command = stub
+        from scitools.easyviz.gnuplot_ import GnuplotBackend
+        class Backend(object):
+            pass
+        backend = Backend()
+        backend._hardcopy_g = g = Gnuplot.Gnuplot()
+        filename = os.path.join(tmpdir, 'tmp_hardcopy.png')
+        g('set output "%s"' % filename)
+        g('set output')
+        # as at the end of GnuplotBackend.hardcopy:
+        GnuplotBackend._sync_hardcopy_g.im_func(backend)
+        assert open(filename).read() == 'complete\n'
+        GnuplotBackend._close_hardcopy_g.im_func(backend)
+    finally:
+        Gnuplot.GnuplotOpts.gnuplot_command = gnuplot_command
+        shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    test_background_hardcopy()
+    test_flush_hooks()
+    test_write_error()
+    test_full_queue_blocks()
+    test_flush_savefig()
+    test_turn_off_plotting()
+    test_turn_off_plotting_one_object()
+    test_gnuplot_hardcopy_complete()
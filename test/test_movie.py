@@ -0,0 +1,151 @@
+import os, sys, shutil, tempfile, time
+import scitools.easyviz.movie
+movie_module = sys.modules['scitools.easyviz.movie']
+_run_pipeline = movie_module._run_pipeline
+_run_commands = movie_module._run_commands
+movie = movie_module.movie
+begin_movie_session = movie_module.begin_movie_session
+MovieEncoder = movie_module.MovieEncoder
+
+# stub programs put first in PATH, each a small shell script:
+stubs = {
+    # write the file given as last argument (like pstopnm -stdout),
+    # fail for files with "bad" in the name
+    'pstopnm': 'for f; do :; done\n'
+               'case "$f" in *bad*) exit 1;; esac\n'
+               'cat "$f"',
+    'pnmtopng': 'tr a-z A-Z',  # filter standard input to output
+    'fail': 'cat > /dev/null; exit 3',
+    # write the movie file given as last argument
+    'convert': 'for f; do :; done\n'
+               'echo movie > "$f"',
+    }
+
+def _setup():
+    """Make a temporary folder with the stub programs in bin and put
+    bin first in PATH. Return the folder and the old PATH."""
+    tmpdir = tempfile.mkdtemp()
+    bindir = os.path.join(tmpdir, 'bin')
+    os.mkdir(bindir)
+    for name in stubs:
+        filename = os.path.join(bindir, name)
+        f = open(filename, 'w')
+        f.write('#!/bin/sh\n' + stubs[name] + '\n')
+        f.close()
+        os.chmod(filename, 0755)
+    path = os.environ['PATH']
+    os.environ['PATH'] = bindir + os.pathsep + path
+    return tmpdir, path
+
+def _teardown(tmpdir, path):
+    os.environ['PATH'] = path
+    shutil.rmtree(tmpdir)
+
+def _write(filename, text):
+    f = open(filename, 'w')
+    f.write(text)
+    f.close()
+
+def test_run_pipeline():
+    tmpdir, path = _setup()
+    try:
+        infile = os.path.join(tmpdir, 'frame.ps')
+        outfile = os.path.join(tmpdir, 'frame.png')
+        _write(infile, 'frame one\n')
+        # the output of each program is the input of the next:
+        status = _run_pipeline([['pstopnm', '-stdout', infile],
+                                ['pnmtopng']], outfile)
+        assert status == 0
+        assert open(outfile).read() == 'FRAME ONE\n'
+        # a failing program gives a nonzero exit status:
+        status = _run_pipeline([['pstopnm', '-stdout', infile], ['fail']],
+                               outfile)
+        assert status == 3
+        # so does a program that is not installed:
+        status = _run_pipeline([['pstopnm', '-stdout', infile],
+                                ['no_such_program_xyz']], outfile)
+        assert status == 127
+    finally:
+        _teardown(tmpdir, path)
+
+def test_run_commands():
+    tmpdir, path = _setup()
+    try:
+        cmds = []
+        for i in range(7):
+            infile = os.path.join(tmpdir, 'frame%d.ps' % i)
+            _write(infile, 'frame %d\n' % i)
+            if i == 2:
+                infile = os.path.join(tmpdir, 'bad.ps')
+                _write(infile, '')
+            pipeline = [['pstopnm', '-stdout', infile], ['pnmtopng']]
+            if i == 4:
+                pipeline[1] = ['no_such_program_xyz']
+            cmds.append((pipeline, os.path.join(tmpdir, 'out%d' % i)))
+        status = _run_commands(cmds, nworkers=3)
+        # one status for each command, in the order of the commands,
+        # also when some of them fail:
+        assert status == [0, 0, 1, 0, 127, 0, 0]
+        for i in (0, 1, 3, 5, 6):
+            assert open(os.path.join(tmpdir, 'out%d' % i)).read() == \
+                   'FRAME %d\n' % i
+    finally:
+        _teardown(tmpdir, path)
+
+def test_any2any_numbering():
+    tmpdir, path = _setup()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmpdir)
+        files = ['a.ps', 'bad.ps', 'c.ps', 'd.ps']
+        for name in files:
+            _write(name, 'frame %s\n' % name[0])
+        me = MovieEncoder(files, encoder='html', quiet=True, nworkers=2,
+                          preferred_package='Netpbm')
+        basename = me._tmp_prefix()
+        new_files = me._any2any(files, basename=basename, ofile_ext='.png')
+        # the failed frame is left out and the others are numbered
+        # without gaps:
+        assert new_files == ['%s%04d.png' % (basename, i)
+                             for i in (1, 2, 3)]
+        assert [open(name).read() for name in new_files] == \
+               ['FRAME A\n', 'FRAME C\n', 'FRAME D\n']
+        assert not os.path.exists('%s%04d.png' % (basename, 4))
+    finally:
+        os.chdir(cwd)
+        _teardown(tmpdir, path)
+
+def test_movie_session_kept():
+    tmpdir, path = _setup()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmpdir)
+        frames = begin_movie_session()
+        for i in range(3):
+            _write(os.path.join(frames, 'tmp%04d.png' % i), 'frame %d' % i)
+        pattern = os.path.join(frames, 'tmp*.png')
+        # several movies can be made from the same plot files:
+        movie(pattern, encoder='convert', output_file='movie1.gif',
+              quiet=True)
+        movie(pattern, encoder='convert', output_file='movie2.gif',
+              quiet=True)
+        assert open('movie2.gif').read() == 'movie\n'
+        assert len(os.listdir(frames)) == 3
+        # the folder is removed, in the background, only when asked for:
+        movie(pattern, encoder='convert', output_file='movie3.gif',
+              quiet=True, remove_frames=True)
+        assert open('movie3.gif').read() == 'movie\n'
+        for i in range(100):
+            if not os.path.exists(frames):
+                break
+            time.sleep(0.05)
+        assert not os.path.exists(frames)
+    finally:
+        os.chdir(cwd)
+        _teardown(tmpdir, path)
+
+if __name__ == '__main__':
+    test_run_pipeline()
+    test_run_commands()
+    test_any2any_numbering()
+    test_movie_session_kept()